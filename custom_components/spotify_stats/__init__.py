@@ -1,31 +1,49 @@
 """The Spotify Statistics integration."""
 from __future__ import annotations
 
+import importlib
 import logging
 import asyncio
+from datetime import datetime, timedelta
 from typing import Any
 
+from aiohttp import ClientError
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
 from homeassistant.helpers import config_entry_oauth2_flow
+from homeassistant.helpers.event import async_track_time_interval
 
-from .const import DOMAIN
+from .const import (
+    CONF_USERNAME,
+    DOMAIN,
+    PLATFORMS,
+    SERVICE_REFRESH_NOW_PLAYING,
+    TOKEN_REFRESH_CHECK_INTERVAL,
+    TOKEN_REFRESH_MARGIN,
+)
 from .coordinator import SpotifyStatsCoordinator
+from .helpers import sanitize_username
+from .services import async_setup_services, async_unload_services
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS: list[Platform] = [Platform.SENSOR]
-
 
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     """Set up the Spotify Statistics component."""
+    # Import the sensor platform once up front so forwarding each user's
+    # entry doesn't need its own trip through the import executor
+    await hass.async_add_import_executor_job(
+        importlib.import_module, f"{__name__}.{Platform.SENSOR}"
+    )
     return True
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Spotify Statistics from a config entry."""
-    _LOGGER.debug("Setting up Spotify Statistics for user: %s", entry.data.get("username"))
+    username = entry.data.get(CONF_USERNAME)
+    _LOGGER.debug("Setting up Spotify Statistics for user: %s", username)
 
     try:
         # Wrap setup in timeout to prevent hanging indefinitely
@@ -33,49 +51,56 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             # Wait for Spotify integration to be ready
             await hass.config_entries.async_wait_component(entry)
             
-            # Get OAuth2 session - try to get implementation
-            try:
-                implementation = (
-                    await config_entry_oauth2_flow.async_get_config_entry_implementation(
-                        hass, entry
-                    )
-                )
-            except ValueError:
-                # Implementation not found - register from spotify domain
-                _LOGGER.debug("OAuth implementation not found, registering from spotify domain")
-                
-                try:
-                    spotify_implementations = await config_entry_oauth2_flow.async_get_implementations(
-                        hass, "spotify"
-                    )
-                except Exception as err:
-                    _LOGGER.warning("Failed to get Spotify implementations: %s", err)
-                    raise ConfigEntryNotReady("Waiting for Spotify integration to be ready") from err
-                
-                if not spotify_implementations:
-                    _LOGGER.warning("Spotify integration not configured or not ready yet")
-                    raise ConfigEntryNotReady("Spotify integration not configured. Please set up the Spotify integration first.")
-                
-                # Register the first available implementation for our domain
-                for impl_domain, impl in spotify_implementations.items():
-                    config_entry_oauth2_flow.async_register_implementation(
-                        hass,
-                        DOMAIN,
-                        impl,
-                    )
-                    _LOGGER.info("Registered Spotify OAuth implementation: %s", impl_domain)
-                    break
-                
-                # Now get the implementation
+            # Reuse the implementation resolved for another entry with the same
+            # auth implementation, otherwise look it up (registering it from the
+            # spotify domain if needed)
+            auth_implementation = entry.data.get("auth_implementation")
+            impl_cache = hass.data.setdefault(DOMAIN, {}).setdefault("_impl", {})
+            if (implementation := impl_cache.get(auth_implementation)) is None:
                 try:
                     implementation = (
                         await config_entry_oauth2_flow.async_get_config_entry_implementation(
                             hass, entry
                         )
                     )
-                except ValueError as err:
-                    _LOGGER.warning("Still cannot get implementation after registration")
-                    raise ConfigEntryNotReady("OAuth implementation not ready, will retry") from err
+                except ValueError:
+                    # Implementation not found - register from spotify domain
+                    _LOGGER.debug("OAuth implementation not found, registering from spotify domain")
+                    
+                    try:
+                        spotify_implementations = await config_entry_oauth2_flow.async_get_implementations(
+                            hass, "spotify"
+                        )
+                    except Exception as err:
+                        _LOGGER.warning("Failed to get Spotify implementations: %s", err)
+                        raise ConfigEntryNotReady("Waiting for Spotify integration to be ready") from err
+                    
+                    if not spotify_implementations:
+                        _LOGGER.warning("Spotify integration not configured or not ready yet")
+                        raise ConfigEntryNotReady("Spotify integration not configured. Please set up the Spotify integration first.")
+                    
+                    # Register the first available implementation for our domain
+                    for impl_domain, impl in spotify_implementations.items():
+                        config_entry_oauth2_flow.async_register_implementation(
+                            hass,
+                            DOMAIN,
+                            impl,
+                        )
+                        _LOGGER.info("Registered Spotify OAuth implementation: %s", impl_domain)
+                        break
+                    
+                    # Now get the implementation
+                    try:
+                        implementation = (
+                            await config_entry_oauth2_flow.async_get_config_entry_implementation(
+                                hass, entry
+                            )
+                        )
+                    except ValueError as err:
+                        _LOGGER.warning("Still cannot get implementation after registration")
+                        raise ConfigEntryNotReady("OAuth implementation not ready, will retry") from err
+                
+                impl_cache[auth_implementation] = implementation
             
             _LOGGER.debug("Got OAuth2 implementation: %s", implementation)
             
@@ -85,23 +110,51 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             # Create coordinator for this user
             coordinator = SpotifyStatsCoordinator(hass, entry, session)
             
-            # Fetch initial data
-            await coordinator.async_config_entry_first_refresh()
+            # Fetch initial data for every polling cadence
+            for account_coordinator in coordinator.coordinators:
+                await account_coordinator.async_config_entry_first_refresh()
             
-            # Store coordinator
+            # Store coordinator, and index it for the services' username lookups
             hass.data.setdefault(DOMAIN, {})
             hass.data[DOMAIN][entry.entry_id] = coordinator
+            hass.data[DOMAIN].setdefault("_by_username", {})[
+                sanitize_username(coordinator.username)
+            ] = coordinator
             
             # Setup platforms
             await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
             
-            # Register services
-            await async_setup_services(hass)
+            # Register services once, they are shared by all accounts
+            if not hass.services.has_service(DOMAIN, SERVICE_REFRESH_NOW_PLAYING):
+                await async_setup_services(hass)
+            
+            # Refresh the OAuth token in the background before it expires, so
+            # coordinator updates never pay for the refresh inline
+            async def _async_check_token(now: datetime) -> None:
+                """Refresh the access token when it is close to expiry."""
+                if coordinator.client.token_expires_in > TOKEN_REFRESH_MARGIN:
+                    return
+                try:
+                    await coordinator.client.async_refresh_token_if_expiring()
+                except Exception as err:
+                    _LOGGER.warning(
+                        "Background token refresh failed for user %s: %s",
+                        username,
+                        err,
+                    )
+
+            entry.async_on_unload(
+                async_track_time_interval(
+                    hass,
+                    _async_check_token,
+                    timedelta(seconds=TOKEN_REFRESH_CHECK_INTERVAL),
+                )
+            )
             
             # Listen for options updates
             entry.async_on_unload(entry.add_update_listener(async_reload_entry))
             
-            _LOGGER.info("Successfully set up Spotify Statistics for user: %s", entry.data.get("username"))
+            _LOGGER.info("Successfully set up Spotify Statistics for user: %s", username)
             
             # Return True inside the timeout block
             return True
@@ -111,37 +164,52 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         raise ConfigEntryNotReady("Spotify integration taking too long to initialize, will retry")
         
     except ConfigEntryAuthFailed as err:
-        _LOGGER.error("Authentication failed for user %s: %s", entry.data.get("username"), err)
+        _LOGGER.error("Authentication failed for user %s: %s", username, err)
+        raise
+        
+    except ConfigEntryNotReady:
+        # Already explains itself, no traceback needed
         raise
         
+    except ClientError as err:
+        # Transient network errors are expected during Spotify outages
+        _LOGGER.warning("Error connecting to Spotify for user %s: %s", username, err)
+        raise ConfigEntryNotReady from err
+        
     except Exception as err:
-        _LOGGER.error("Error setting up Spotify Statistics for user %s: %s", entry.data.get("username"), err, exc_info=True)
+        _LOGGER.error("Error setting up Spotify Statistics for user %s: %s", username, err, exc_info=True)
         raise ConfigEntryNotReady from err
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    _LOGGER.debug("Unloading Spotify Statistics for user: %s", entry.data.get("username"))
+    username = entry.data.get(CONF_USERNAME)
+    _LOGGER.debug("Unloading Spotify Statistics for user: %s", username)
     
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        coordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator: SpotifyStatsCoordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        by_username = hass.data[DOMAIN]["_by_username"]
+        by_username.pop(sanitize_username(coordinator.username), None)
         
         # Cancel any pending updates
-        if hasattr(coordinator, 'async_shutdown'):
-            await coordinator.async_shutdown()
+        await coordinator.async_shutdown()
+        
+        # Remove services along with the last account, and forget the
+        # implementation so a new setup resolves the current credentials
+        if not by_username:
+            async_unload_services(hass)
+            hass.data[DOMAIN].pop("_impl", None)
     
     return unload_ok
 
 
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload config entry when options change."""
-    _LOGGER.debug("Reloading Spotify Statistics for user: %s", entry.data.get("username"))
+    coordinator = hass.data[DOMAIN].get(entry.entry_id)
+    
+    # Token refreshes also update entry data, only reload for option changes
+    if coordinator is not None and not coordinator.options_changed(entry):
+        return
+    
+    _LOGGER.debug("Reloading Spotify Statistics for user: %s", entry.data.get(CONF_USERNAME))
     await hass.config_entries.async_reload(entry.entry_id)
 
-
-async def async_setup_services(hass: HomeAssistant) -> None:
-    """Set up services for the integration."""
-    from .services import async_setup_services as setup_services
-    
-    # Only setup services once
-    if DOMAIN not in hass.services.async_services():
-        await setup_services(hass)
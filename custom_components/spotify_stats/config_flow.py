@@ -10,8 +10,11 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import config_entry_oauth2_flow
+from homeassistant.helpers.selector import SelectSelector, SelectSelectorConfig
 
 from .const import (
+    ALL_SENSORS,
+    CONF_ENABLED_SENSORS,
     CONF_NOW_PLAYING_INTERVAL,
     CONF_RECENTLY_PLAYED_INTERVAL,
     CONF_USERNAME,
@@ -22,15 +25,49 @@ from .const import (
     MAX_RECENTLY_PLAYED_INTERVAL,
     MIN_NOW_PLAYING_INTERVAL,
     MIN_RECENTLY_PLAYED_INTERVAL,
-    SPOTIFY_SCOPES,
+    SPOTIFY_SCOPE_STRING,
 )
+from .helpers import sanitize_username
 
 _LOGGER = logging.getLogger(__name__)
 
+_NOW_PLAYING_INTERVAL_VALIDATOR = vol.All(
+    vol.Coerce(int),
+    vol.Range(min=MIN_NOW_PLAYING_INTERVAL, max=MAX_NOW_PLAYING_INTERVAL),
+)
+_RECENTLY_PLAYED_INTERVAL_VALIDATOR = vol.All(
+    vol.Coerce(int),
+    vol.Range(min=MIN_RECENTLY_PLAYED_INTERVAL, max=MAX_RECENTLY_PLAYED_INTERVAL),
+)
+
+_USER_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_USERNAME): str,
+        vol.Optional(
+            CONF_NOW_PLAYING_INTERVAL,
+            default=DEFAULT_NOW_PLAYING_INTERVAL,
+        ): _NOW_PLAYING_INTERVAL_VALIDATOR,
+        vol.Optional(
+            CONF_RECENTLY_PLAYED_INTERVAL,
+            default=DEFAULT_RECENTLY_PLAYED_INTERVAL,
+        ): _RECENTLY_PLAYED_INTERVAL_VALIDATOR,
+    }
+)
 
-def sanitize_username(username: str) -> str:
-    """Convert username to valid entity ID format."""
-    return username.lower().replace(" ", "_").replace("-", "_")
+# Current values are filled in per entry as suggested values
+_OPTIONS_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_NOW_PLAYING_INTERVAL): _NOW_PLAYING_INTERVAL_VALIDATOR,
+        vol.Required(CONF_RECENTLY_PLAYED_INTERVAL): _RECENTLY_PLAYED_INTERVAL_VALIDATOR,
+        vol.Required(CONF_ENABLED_SENSORS): SelectSelector(
+            SelectSelectorConfig(
+                options=list(ALL_SENSORS),
+                multiple=True,
+                translation_key=CONF_ENABLED_SENSORS,
+            )
+        ),
+    }
+)
 
 
 class SpotifyStatsFlowHandler(
@@ -56,7 +93,7 @@ class SpotifyStatsFlowHandler(
     @property
     def extra_authorize_data(self) -> dict[str, Any]:
         """Extra data that needs to be appended to the authorize url."""
-        return {"scope": " ".join(SPOTIFY_SCOPES)}
+        return {"scope": SPOTIFY_SCOPE_STRING}
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
@@ -96,10 +133,10 @@ class SpotifyStatsFlowHandler(
             
             # Check if username already exists
             username = sanitize_username(self._username)
-            existing_usernames = [
+            existing_usernames = {
                 sanitize_username(entry.data.get(CONF_USERNAME, ""))
                 for entry in self._async_current_entries()
-            ]
+            }
             
             if username in existing_usernames:
                 return self.async_abort(reason="already_configured")
@@ -109,31 +146,7 @@ class SpotifyStatsFlowHandler(
 
         return self.async_show_form(
             step_id="user",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_USERNAME): str,
-                    vol.Optional(
-                        CONF_NOW_PLAYING_INTERVAL,
-                        default=DEFAULT_NOW_PLAYING_INTERVAL,
-                    ): vol.All(
-                        vol.Coerce(int),
-                        vol.Range(
-                            min=MIN_NOW_PLAYING_INTERVAL,
-                            max=MAX_NOW_PLAYING_INTERVAL,
-                        ),
-                    ),
-                    vol.Optional(
-                        CONF_RECENTLY_PLAYED_INTERVAL,
-                        default=DEFAULT_RECENTLY_PLAYED_INTERVAL,
-                    ): vol.All(
-                        vol.Coerce(int),
-                        vol.Range(
-                            min=MIN_RECENTLY_PLAYED_INTERVAL,
-                            max=MAX_RECENTLY_PLAYED_INTERVAL,
-                        ),
-                    ),
-                }
-            ),
+            data_schema=_USER_SCHEMA,
             description_placeholders={
                 "username_help": "Your Spotify username (e.g., 'planetbuilders')",
             },
@@ -177,6 +190,7 @@ class SpotifyStatsOptionsFlowHandler(config_entries.OptionsFlow):
             new_data = dict(self.config_entry.data)
             new_data[CONF_NOW_PLAYING_INTERVAL] = user_input[CONF_NOW_PLAYING_INTERVAL]
             new_data[CONF_RECENTLY_PLAYED_INTERVAL] = user_input[CONF_RECENTLY_PLAYED_INTERVAL]
+            new_data[CONF_ENABLED_SENSORS] = user_input[CONF_ENABLED_SENSORS]
             
             self.hass.config_entries.async_update_entry(
                 self.config_entry,
@@ -187,34 +201,21 @@ class SpotifyStatsOptionsFlowHandler(config_entries.OptionsFlow):
 
         return self.async_show_form(
             step_id="init",
-            data_schema=vol.Schema(
+            data_schema=self.add_suggested_values_to_schema(
+                _OPTIONS_SCHEMA,
                 {
-                    vol.Optional(
+                    CONF_NOW_PLAYING_INTERVAL: self.config_entry.data.get(
                         CONF_NOW_PLAYING_INTERVAL,
-                        default=self.config_entry.data.get(
-                            CONF_NOW_PLAYING_INTERVAL,
-                            DEFAULT_NOW_PLAYING_INTERVAL,
-                        ),
-                    ): vol.All(
-                        vol.Coerce(int),
-                        vol.Range(
-                            min=MIN_NOW_PLAYING_INTERVAL,
-                            max=MAX_NOW_PLAYING_INTERVAL,
-                        ),
+                        DEFAULT_NOW_PLAYING_INTERVAL,
                     ),
-                    vol.Optional(
+                    CONF_RECENTLY_PLAYED_INTERVAL: self.config_entry.data.get(
                         CONF_RECENTLY_PLAYED_INTERVAL,
-                        default=self.config_entry.data.get(
-                            CONF_RECENTLY_PLAYED_INTERVAL,
-                            DEFAULT_RECENTLY_PLAYED_INTERVAL,
-                        ),
-                    ): vol.All(
-                        vol.Coerce(int),
-                        vol.Range(
-                            min=MIN_RECENTLY_PLAYED_INTERVAL,
-                            max=MAX_RECENTLY_PLAYED_INTERVAL,
-                        ),
+                        DEFAULT_RECENTLY_PLAYED_INTERVAL,
                     ),
-                }
+                    CONF_ENABLED_SENSORS: self.config_entry.data.get(
+                        CONF_ENABLED_SENSORS,
+                        list(ALL_SENSORS),
+                    ),
+                },
             ),
         )
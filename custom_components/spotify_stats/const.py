@@ -1,8 +1,10 @@
 """Constants for the Spotify Statistics integration."""
+from types import MappingProxyType
+
 from homeassistant.const import Platform
 
 DOMAIN = "spotify_stats"
-PLATFORMS = [Platform.SENSOR]
+PLATFORMS = (Platform.SENSOR,)
 
 # Configuration constants
 CONF_USERNAME = "username"
@@ -10,6 +12,7 @@ CONF_CLIENT_ID = "client_id"
 CONF_CLIENT_SECRET = "client_secret"
 CONF_NOW_PLAYING_INTERVAL = "now_playing_interval"
 CONF_RECENTLY_PLAYED_INTERVAL = "recently_played_interval"
+CONF_ENABLED_SENSORS = "enabled_sensors"
 
 # Default values
 DEFAULT_NOW_PLAYING_INTERVAL = 30  # seconds
@@ -20,7 +23,7 @@ MIN_RECENTLY_PLAYED_INTERVAL = 300
 MAX_RECENTLY_PLAYED_INTERVAL = 3600
 
 # Spotify API scopes required
-SPOTIFY_SCOPES = [
+SPOTIFY_SCOPES = (
     "user-read-currently-playing",
     "user-read-recently-played",
     "user-top-read",
@@ -28,7 +31,8 @@ SPOTIFY_SCOPES = [
     "user-library-read",
     "playlist-read-private",
     "playlist-read-collaborative",
-]
+)
+SPOTIFY_SCOPE_STRING = " ".join(SPOTIFY_SCOPES)
 
 # Sensor types
 SENSOR_NOW_PLAYING = "now_playing"
@@ -43,20 +47,33 @@ SENSOR_TOP_TRACKS_ALLTIME = "top_tracks_alltime"
 SENSOR_USER_PLAYLISTS = "user_playlists"
 SENSOR_SAVED_TRACKS = "saved_tracks"
 SENSOR_SAVED_ALBUMS = "saved_albums"
-SENSOR_USER_PLAYLISTS = "user_playlists"
-SENSOR_SAVED_TRACKS = "saved_tracks"
-SENSOR_SAVED_ALBUMS = "saved_albums"
+
+# Sensors created when no selection has been made
+ALL_SENSORS = (
+    SENSOR_NOW_PLAYING,
+    SENSOR_RECENTLY_PLAYED,
+    SENSOR_FOLLOWED_ARTISTS,
+    SENSOR_TOP_ARTISTS_4WEEKS,
+    SENSOR_TOP_ARTISTS_6MONTHS,
+    SENSOR_TOP_ARTISTS_ALLTIME,
+    SENSOR_TOP_TRACKS_4WEEKS,
+    SENSOR_TOP_TRACKS_6MONTHS,
+    SENSOR_TOP_TRACKS_ALLTIME,
+    SENSOR_USER_PLAYLISTS,
+    SENSOR_SAVED_TRACKS,
+    SENSOR_SAVED_ALBUMS,
+)
 
 # Time ranges for top stats
 TIME_RANGE_SHORT = "short_term"  # 4 weeks
 TIME_RANGE_MEDIUM = "medium_term"  # 6 months
 TIME_RANGE_LONG = "long_term"  # all time
 
-TIME_RANGE_MAP = {
+TIME_RANGE_MAP = MappingProxyType({
     "4weeks": TIME_RANGE_SHORT,
     "6months": TIME_RANGE_MEDIUM,
     "alltime": TIME_RANGE_LONG,
-}
+})
 
 # Service names
 SERVICE_EXPORT_FOLLOWED_ARTISTS = "export_followed_artists"
@@ -80,3 +97,18 @@ UPDATE_INTERVAL_NOW_PLAYING = 30
 UPDATE_INTERVAL_RECENTLY_PLAYED = 300
 UPDATE_INTERVAL_TOP_STATS = 86400  # Daily
 UPDATE_INTERVAL_FOLLOWED = 3600  # Hourly
+UPDATE_INTERVAL_LIBRARY = 900  # Playlists and saved library
+NOW_PLAYING_TRACK_END_MARGIN = 2  # Poll this long after the track is due to end
+
+# Spotify Web API
+SPOTIFY_API_URL = "https://api.spotify.com/v1"
+SPOTIFY_REQUEST_TIMEOUT = 10  # seconds
+
+# Spotify API request limits
+DEFAULT_RATE_LIMIT = 10  # Requests per second
+DEFAULT_CONCURRENCY = 8  # Requests in flight, a whole top stats refresh (7) fits at once
+DEFAULT_EXPORT_CONCURRENCY = 2  # Export requests in flight, the rest is left for polling
+
+# OAuth token refresh (in seconds)
+TOKEN_REFRESH_CHECK_INTERVAL = 60
+TOKEN_REFRESH_MARGIN = 300  # Refresh when this close to expiry
@@ -1,26 +1,42 @@
 """DataUpdateCoordinator for Spotify Statistics."""
 from __future__ import annotations
 
+from abc import ABC, abstractmethod
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
 from datetime import timedelta
+from functools import partial
+from itertools import islice
 import logging
+from operator import itemgetter
+import time
 from typing import Any
 
+import aiohttp
 import spotipy
-from spotipy.oauth2 import SpotifyOAuth
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_ACCESS_TOKEN
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.config_entry_oauth2_flow import OAuth2Session
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
-from homeassistant.util import dt as dt_util
+from homeassistant.util.json import json_loads
 
 from .const import (
+    ALL_SENSORS,
+    CONF_ENABLED_SENSORS,
     CONF_NOW_PLAYING_INTERVAL,
     CONF_RECENTLY_PLAYED_INTERVAL,
     CONF_USERNAME,
+    DEFAULT_CONCURRENCY,
+    DEFAULT_EXPORT_CONCURRENCY,
+    DEFAULT_NOW_PLAYING_INTERVAL,
+    DEFAULT_RATE_LIMIT,
+    DEFAULT_RECENTLY_PLAYED_INTERVAL,
     DOMAIN,
+    NOW_PLAYING_TRACK_END_MARGIN,
     SENSOR_FOLLOWED_ARTISTS,
     SENSOR_NOW_PLAYING,
     SENSOR_RECENTLY_PLAYED,
@@ -33,67 +49,287 @@ from .const import (
     SENSOR_TOP_TRACKS_6MONTHS,
     SENSOR_TOP_TRACKS_ALLTIME,
     SENSOR_USER_PLAYLISTS,
+    SPOTIFY_API_URL,
+    SPOTIFY_REQUEST_TIMEOUT,
     TIME_RANGE_LONG,
     TIME_RANGE_MEDIUM,
     TIME_RANGE_SHORT,
+    TOKEN_REFRESH_MARGIN,
     UPDATE_INTERVAL_FOLLOWED,
+    UPDATE_INTERVAL_LIBRARY,
     UPDATE_INTERVAL_TOP_STATS,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+_REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=SPOTIFY_REQUEST_TIMEOUT)
+
+# Fields read from every track and artist object, looked up in a single call
+_TRACK_FIELDS = itemgetter(
+    "id", "name", "artists", "album", "external_urls", "duration_ms"
+)
+_ARTIST_FIELDS = itemgetter("id", "name", "external_urls", "images")
+
+# Time range with its top artists and top tracks data keys
+_TOP_STATS_PERIODS = (
+    (TIME_RANGE_SHORT, SENSOR_TOP_ARTISTS_4WEEKS, SENSOR_TOP_TRACKS_4WEEKS),
+    (TIME_RANGE_MEDIUM, SENSOR_TOP_ARTISTS_6MONTHS, SENSOR_TOP_TRACKS_6MONTHS),
+    (TIME_RANGE_LONG, SENSOR_TOP_ARTISTS_ALLTIME, SENSOR_TOP_TRACKS_ALLTIME),
+)
+
+
+def _configured_options(entry: ConfigEntry) -> tuple[Any, ...]:
+    """Return the entry data that needs a reload when it changes."""
+    return (
+        entry.data.get(CONF_NOW_PLAYING_INTERVAL, DEFAULT_NOW_PLAYING_INTERVAL),
+        entry.data.get(CONF_RECENTLY_PLAYED_INTERVAL, DEFAULT_RECENTLY_PLAYED_INTERVAL),
+        frozenset(entry.data.get(CONF_ENABLED_SENSORS, ALL_SENSORS)),
+    )
+
+
+def _now_playing_track_details(track: dict[str, Any]) -> dict[str, Any]:
+    """Build the parts of now playing that are fixed for a track."""
+    track_id, name, artists, album, urls, duration_ms = _TRACK_FIELDS(track)
+    return {
+        "track_id": track_id,
+        "track_name": name,
+        "artist_id": artists[0]["id"],
+        "artist_name": artists[0]["name"],
+        "album_name": album["name"],
+        "album_id": album["id"],
+        "image_url": album["images"][0]["url"] if album["images"] else None,
+        "duration_ms": duration_ms,
+        "popularity": track.get("popularity", 0),
+        "track_url": urls["spotify"],
+    }
+
+
+def _recent_track_row(item: dict[str, Any]) -> dict[str, Any]:
+    """Build a recently played entry."""
+    track = item["track"]
+    track_id, name, artists, album, urls, duration_ms = _TRACK_FIELDS(track)
+    return {
+        "played_at": item["played_at"],
+        "track_id": track_id,
+        "track_name": name,
+        "artist_id": artists[0]["id"],
+        "artist_name": artists[0]["name"],
+        "album_name": album["name"],
+        "album_id": album["id"],
+        "track_url": urls["spotify"],
+        "duration_ms": duration_ms,
+        "popularity": track.get("popularity", 0),
+        "explicit": track.get("explicit", False),
+    }
+
+
+def _playlist_row(playlist: dict[str, Any]) -> dict[str, Any]:
+    """Build a playlists entry."""
+    owner = playlist["owner"]
+    return {
+        "id": playlist["id"],
+        "name": playlist["name"],
+        "url": playlist["external_urls"]["spotify"],
+        "uri": playlist["uri"],
+        "tracks_total": playlist["tracks"]["total"],
+        "description": playlist.get("description", ""),
+        "public": playlist.get("public", False),
+        "collaborative": playlist.get("collaborative", False),
+        "owner": owner["display_name"],
+        "owner_id": owner["id"],
+    }
+
+
+def _saved_track_row(item: dict[str, Any]) -> dict[str, Any] | None:
+    """Build a saved tracks entry, or None if the track can't be shown."""
+    track = item.get("track")
+
+    # Skip if track is None (deleted/unavailable)
+    if not track:
+        _LOGGER.warning("Skipping saved track with no data (possibly deleted)")
+        return None
+
+    # Skip if track doesn't have required fields
+    if not track.get("id") or not track.get("artists") or not track.get("album"):
+        _LOGGER.warning("Skipping track with missing data: %s", track.get("name", "Unknown"))
+        return None
+
+    try:
+        return {
+            "id": track["id"],
+            "name": track.get("name", "Unknown Track"),
+            "artist_name": track["artists"][0]["name"],
+            "artist_id": track["artists"][0]["id"],
+            "album_name": track["album"]["name"],
+            "album_id": track["album"]["id"],
+            "url": track["external_urls"]["spotify"],
+            "uri": track.get("uri", ""),
+            "duration_ms": track.get("duration_ms", 0),
+            "popularity": track.get("popularity", 0),
+            "added_at": item.get("added_at", ""),
+        }
+    except (KeyError, IndexError, TypeError) as err:
+        _LOGGER.warning("Error processing track %s: %s", track.get("name", "Unknown"), err)
+        return None
+
+
+def _saved_album_row(item: dict[str, Any]) -> dict[str, Any] | None:
+    """Build a saved albums entry, or None if the album can't be shown."""
+    album = item.get("album")
+
+    # Skip if album is None (deleted/unavailable)
+    if not album:
+        _LOGGER.warning("Skipping saved album with no data (possibly deleted)")
+        return None
+
+    # Skip if album doesn't have required fields
+    if not album.get("id") or not album.get("artists"):
+        _LOGGER.warning("Skipping album with missing data: %s", album.get("name", "Unknown"))
+        return None
+
+    try:
+        return {
+            "id": album["id"],
+            "name": album.get("name", "Unknown Album"),
+            "artist_name": album["artists"][0]["name"],
+            "artist_id": album["artists"][0]["id"],
+            "url": album["external_urls"]["spotify"],
+            "uri": album.get("uri", ""),
+            "total_tracks": album.get("total_tracks", 0),
+            "release_date": album.get("release_date", ""),
+            "added_at": item.get("added_at", ""),
+        }
+    except (KeyError, IndexError, TypeError) as err:
+        _LOGGER.warning("Error processing album %s: %s", album.get("name", "Unknown"), err)
+        return None
+
+
+def _followed_artist_row(artist: dict[str, Any]) -> dict[str, Any]:
+    """Build a followed artists entry."""
+    artist_id, name, urls, images = _ARTIST_FIELDS(artist)
+    return {
+        "id": artist_id,
+        "name": name,
+        "url": urls["spotify"],
+        "image": images[0]["url"] if images else None,
+        "genres": artist.get("genres", []),
+        "popularity": artist.get("popularity", 0),
+    }
+
+
+def _top_artist_row(rank: int, artist: dict[str, Any]) -> dict[str, Any]:
+    """Build a top artists entry."""
+    get = artist.get
+    return {
+        "id": artist["id"],
+        "name": artist["name"],
+        "url": artist["external_urls"]["spotify"],
+        "rank": rank,
+        "genres": get("genres", []),
+        "popularity": get("popularity", 0),
+    }
+
+
+def _top_track_row(rank: int, track: dict[str, Any]) -> dict[str, Any]:
+    """Build a top tracks entry."""
+    artist = track["artists"][0]
+    return {
+        "id": track["id"],
+        "name": track["name"],
+        "artist_name": artist["name"],
+        "artist_id": artist["id"],
+        "album_name": track["album"]["name"],
+        "url": track["external_urls"]["spotify"],
+        "rank": rank,
+        "popularity": track.get("popularity", 0),
+    }
+
+
+class SpotifyRateLimiter:
+    """Token bucket limiting the rate and concurrency of Spotify API calls."""
+
+    def __init__(
+        self, rate: float, concurrency: int, export_concurrency: int
+    ) -> None:
+        """Initialize the limiter."""
+        self._rate = rate
+        self._tokens = rate
+        self._updated = time.monotonic()
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._bucket_lock = asyncio.Lock()
+        # Exports queue every page at once, only let a few of them wait for the
+        # bucket so polling requests aren't stuck behind a whole export
+        self.export_slots = asyncio.Semaphore(export_concurrency)
+
+    async def __aenter__(self) -> None:
+        """Wait for a free slot and a bucket token."""
+        await self._semaphore.acquire()
+        try:
+            await self._async_take_token()
+        except BaseException:
+            self._semaphore.release()
+            raise
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Release the slot."""
+        self._semaphore.release()
+
+    async def _async_take_token(self) -> None:
+        """Take a token from the bucket, sleeping until one has leaked in."""
+        async with self._bucket_lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._rate, self._tokens + (now - self._updated) * self._rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self._rate)
 
-class SpotifyStatsCoordinator(DataUpdateCoordinator):
-    """Class to manage fetching Spotify data."""
+
+class SpotifyStatsClient:
+    """Spotify API access shared by the coordinators of one account."""
 
     def __init__(
         self, hass: HomeAssistant, entry: ConfigEntry, session: OAuth2Session
     ) -> None:
-        """Initialize the coordinator."""
-        _LOGGER.debug("SpotifyStatsCoordinator.__init__ starting for user: %s", entry.data.get(CONF_USERNAME))
-        
+        """Initialize the client."""
+        self.hass = hass
         self.session = session
         self.entry = entry
         self.username = entry.data[CONF_USERNAME]
 
-        # Get update intervals from config
-        self.now_playing_interval = entry.data.get(
-            CONF_NOW_PLAYING_INTERVAL, 30
-        )
-        self.recently_played_interval = entry.data.get(
-            CONF_RECENTLY_PLAYED_INTERVAL, 300
-        )
-        
-        _LOGGER.debug("SpotifyStatsCoordinator: Update intervals - now_playing: %s, recently_played: %s", 
-                     self.now_playing_interval, self.recently_played_interval)
-
-        # Spotify client (will be initialized lazily)
-        self.sp: spotipy.Spotify | None = None
-        self._sp_initialized = False
-        
-        _LOGGER.debug("SpotifyStatsCoordinator: Spotify client variables initialized")
-
-        # Track last update times for different data types
-        self._last_followed_update = None
-        self._last_top_stats_update = None
-        
-        _LOGGER.debug("SpotifyStatsCoordinator: About to call super().__init__")
-
-        super().__init__(
-            hass,
-            _LOGGER,
-            name=f"{DOMAIN}_{self.username}",
-            update_interval=timedelta(seconds=self.now_playing_interval),
-        )
-        
-        _LOGGER.debug("SpotifyStatsCoordinator.__init__ completed for user: %s", self.username)
+        # Access token sent with requests, set by async_prepare
+        self._current_token: str | None = None
+        self._cached_access_token: str | None = None
+        self._token_expires_at: float = 0.0
+        # ETag and payload of the last response to each conditional request
+        self._etag_cache: dict[tuple[str, frozenset], tuple[str, dict[str, Any]]] = {}
+        self._refresh_lock = asyncio.Lock()
+        # Spotify rate limits per application, so every account shares one limiter
+        domain_data = hass.data.setdefault(DOMAIN, {})
+        if (rate_limiter := domain_data.get("_rate_limiter")) is None:
+            rate_limiter = domain_data["_rate_limiter"] = SpotifyRateLimiter(
+                DEFAULT_RATE_LIMIT, DEFAULT_CONCURRENCY, DEFAULT_EXPORT_CONCURRENCY
+            )
+        self._rate_limiter: SpotifyRateLimiter = rate_limiter
 
     async def _async_ensure_token_valid(self) -> str:
         """Ensure we have a valid access token."""
+        # Skip the session check while the last validated token is comfortably valid
+        if (
+            self._cached_access_token is not None
+            and time.time() < self._token_expires_at - TOKEN_REFRESH_MARGIN
+        ):
+            return self._cached_access_token
+        
         try:
-            await self.session.async_ensure_token_valid()
+            # Don't let the session refresh alongside a refresh of our own
+            async with self._refresh_lock:
+                await self.session.async_ensure_token_valid()
             token = self.session.token
-            _LOGGER.debug("Token keys available: %s", list(token.keys()))
             
             # OAuth2 tokens use 'access_token' not CONF_ACCESS_TOKEN
             if "access_token" in token:
@@ -104,449 +340,444 @@ class SpotifyStatsCoordinator(DataUpdateCoordinator):
                 _LOGGER.error("No access_token found in token dict. Available keys: %s", list(token.keys()))
                 raise ConfigEntryAuthFailed("No access token in session")
             
-            _LOGGER.debug("Got access token: %s...", access_token[:20] if access_token else "None")
+            self._cache_token(access_token, token.get("expires_at", 0))
             return access_token
         except Exception as err:
             _LOGGER.error("Failed to refresh Spotify token: %s", err, exc_info=True)
             raise ConfigEntryAuthFailed from err
 
-    def _init_spotify_client(self, access_token: str) -> None:
-        """Initialize the Spotify client with access token."""
-        _LOGGER.debug("_init_spotify_client called for user: %s with token: %s...", 
-                     self.username, access_token[:20] if access_token else "None")
-        
-        try:
-            # Always recreate the client with the latest token
-            # spotipy.Spotify(auth=token) creates a simple client that uses bearer token auth
-            self.sp = spotipy.Spotify(auth=access_token)
-            self._sp_initialized = True
-            
-            _LOGGER.debug("Initialized Spotify client for user: %s", self.username)
-        except Exception as err:
-            _LOGGER.error("Failed to initialize Spotify client: %s", err, exc_info=True)
-            raise ConfigEntryAuthFailed from err
+    @property
+    def token_expires_in(self) -> float:
+        """Return the number of seconds until the access token expires."""
+        return self.session.token.get("expires_at", 0) - time.time()
 
-    async def _async_update_data(self) -> dict[str, Any]:
-        """Fetch data from Spotify API."""
-        _LOGGER.debug("_async_update_data called for user: %s", self.username)
-        
+    async def async_refresh_token(self) -> str:
+        """Force an OAuth token refresh and store the new token on the entry."""
+        new_token = await self.session.implementation.async_refresh_token(
+            self.session.token
+        )
+        self.hass.config_entries.async_update_entry(
+            self.entry, data={**self.entry.data, "token": new_token}
+        )
+        _LOGGER.debug("Refreshed Spotify access token for user: %s", self.username)
+        self._cache_token(new_token["access_token"], new_token.get("expires_at", 0))
+        return new_token["access_token"]
+
+    async def async_refresh_token_if_expiring(self) -> None:
+        """Refresh the token ahead of expiry, one refresh at a time."""
+        async with self._refresh_lock:
+            # A refresh after a rejected token may have just replaced it
+            if self.token_expires_in > TOKEN_REFRESH_MARGIN:
+                return
+            self._current_token = await self.async_refresh_token()
+
+    def _cache_token(self, access_token: str | None, expires_at: float) -> None:
+        """Remember the last validated access token and its expiry."""
+        self._cached_access_token = access_token
+        self._token_expires_at = expires_at
+
+    @property
+    def current_token(self) -> str | None:
+        """Return the access token requests are sent with."""
+        return self._current_token
+
+    async def async_prepare(self) -> None:
+        """Make sure requests are sent with a valid access token."""
         try:
             # Ensure we have a valid token
-            _LOGGER.debug("_async_update_data: Checking for valid token...")
-            access_token = await self._async_ensure_token_valid()
-            _LOGGER.debug("_async_update_data: Got valid access token: %s...", access_token[:20] if access_token else "None")
-            
-            # Initialize/update Spotify client
-            _LOGGER.debug("_async_update_data: Initializing Spotify client...")
-            await self.hass.async_add_executor_job(
-                self._init_spotify_client, access_token
-            )
-            _LOGGER.debug("_async_update_data: Spotify client initialized successfully")
-            
+            self._current_token = await self._async_ensure_token_valid()
         except ConfigEntryAuthFailed as err:
-            _LOGGER.error("_async_update_data: Authentication failed: %s", err, exc_info=True)
+            _LOGGER.error("async_prepare: Authentication failed: %s", err, exc_info=True)
             raise
         except Exception as err:
-            _LOGGER.error("_async_update_data: Failed to setup Spotify client: %s", err, exc_info=True)
+            _LOGGER.error("async_prepare: Failed to setup Spotify client: %s", err, exc_info=True)
             raise UpdateFailed(f"Authentication failed: {err}") from err
-        
-        try:
-            data = {}
-            
-            _LOGGER.debug("_async_update_data: Fetching now playing")
-            # Always update now playing and recently played
-            data[SENSOR_NOW_PLAYING] = await self.hass.async_add_executor_job(
-                self._fetch_now_playing
-            )
-            _LOGGER.debug("_async_update_data: Now playing fetched successfully")
+
+    async def async_handle_unauthorized(self, rejected_token: str | None) -> None:
+        """Refresh the token after Spotify rejected it, once per rejected token."""
+        async with self._refresh_lock:
+            # Another coordinator already replaced the rejected token
+            if self._current_token != rejected_token:
+                return
             
-            _LOGGER.debug("_async_update_data: Fetching recently played")
-            data[SENSOR_RECENTLY_PLAYED] = await self.hass.async_add_executor_job(
-                self._fetch_recently_played
-            )
-            _LOGGER.debug("_async_update_data: Recently played fetched successfully")
+            _LOGGER.debug("Access token rejected for user %s, refreshing", self.username)
+            self._cache_token(None, 0)
+            try:
+                self._current_token = await self.async_refresh_token()
+            except aiohttp.ClientResponseError as err:
+                # The token endpoint turned the refresh token down, e.g. invalid_grant
+                if 400 <= err.status < 500:
+                    raise ConfigEntryAuthFailed("Spotify authentication expired") from err
+                raise UpdateFailed(f"Token refresh failed: {err}") from err
+            except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+                # Network trouble, try again on the next poll instead of reauthenticating
+                raise UpdateFailed(f"Token refresh failed: {err}") from err
+
+    async def async_get(
+        self, path: str, *, conditional: bool = False, **params: Any
+    ) -> dict[str, Any] | None:
+        """Issue a GET against the Spotify Web API.
+
+        Returns None when Spotify answers without content. Error responses are
+        raised as SpotifyException, the same as spotipy does. Conditional
+        requests send the last ETag and return the previous payload, the same
+        object, when Spotify reports it unchanged.
+        """
+        params = {key: value for key, value in params.items() if value is not None}
+        headers = {"Authorization": f"Bearer {self._current_token}"}
+
+        cache_key = (path, frozenset(params.items()))
+        cached = self._etag_cache.get(cache_key) if conditional else None
+        if cached is not None:
+            headers["If-None-Match"] = cached[0]
 
-            # Update followed artists hourly
-            if self._should_update_followed():
-                data[SENSOR_FOLLOWED_ARTISTS] = await self.hass.async_add_executor_job(
-                    self._fetch_followed_artists
+        # Home Assistant's shared session keeps connections to Spotify warm
+        async with self._rate_limiter, async_get_clientsession(self.hass).get(
+            f"{SPOTIFY_API_URL}/{path}",
+            params=params,
+            headers=headers,
+            timeout=_REQUEST_TIMEOUT,
+        ) as response:
+            if response.status == 304 and cached is not None:
+                return cached[1]
+            if response.status == 204:
+                return None
+            if response.status >= 400:
+                raise spotipy.exceptions.SpotifyException(
+                    response.status,
+                    -1,
+                    f"{response.url}: {await response.text()}",
+                    headers=response.headers,
                 )
-                self._last_followed_update = dt_util.utcnow()
-            else:
-                data[SENSOR_FOLLOWED_ARTISTS] = self.data.get(SENSOR_FOLLOWED_ARTISTS)
-
-            # Update top stats daily
-            if self._should_update_top_stats():
-                data.update(await self.hass.async_add_executor_job(
-                    self._fetch_top_stats
-                ))
-                self._last_top_stats_update = dt_util.utcnow()
-            else:
-                # Use cached data
-                for key in [
-                    SENSOR_TOP_ARTISTS_4WEEKS,
-                    SENSOR_TOP_ARTISTS_6MONTHS,
-                    SENSOR_TOP_ARTISTS_ALLTIME,
-                    SENSOR_TOP_TRACKS_4WEEKS,
-                    SENSOR_TOP_TRACKS_6MONTHS,
-                    SENSOR_TOP_TRACKS_ALLTIME,
-                ]:
-                    data[key] = self.data.get(key)
-
-            _LOGGER.debug("_async_update_data: Fetching playlists")
-            data[SENSOR_USER_PLAYLISTS] = await self.hass.async_add_executor_job(
-                self._fetch_user_playlists
-            )
-            _LOGGER.debug("_async_update_data: Playlists fetched successfully")
-            
-            _LOGGER.debug("_async_update_data: Fetching saved tracks")
-            data[SENSOR_SAVED_TRACKS] = await self.hass.async_add_executor_job(
-                self._fetch_saved_tracks
-            )
-            _LOGGER.debug("_async_update_data: Saved tracks fetched successfully")
-            
-            _LOGGER.debug("_async_update_data: Fetching saved albums")
-            data[SENSOR_SAVED_ALBUMS] = await self.hass.async_add_executor_job(
-                self._fetch_saved_albums
-            )
-            _LOGGER.debug("_async_update_data: Saved albums fetched successfully")
+            # orjson parses the raw bytes, no need to decode them to str first
+            payload = json_loads(await response.read())
+            if conditional and (etag := response.headers.get("ETag")):
+                self._etag_cache[cache_key] = (etag, payload)
+            return payload
+
+    async def async_export_get(
+        self, path: str, **params: Any
+    ) -> dict[str, Any] | None:
+        """Issue a GET for an export, within the exports' share of the limiter."""
+        async with self._rate_limiter.export_slots:
+            return await self.async_get(path, **params)
 
-            return data
+    async def async_close(self) -> None:
+        """Forget the access token and cached responses."""
+        self._current_token = None
+        self._cache_token(None, 0)
+        self._etag_cache.clear()
+
+
+class SpotifyStatsBaseCoordinator(DataUpdateCoordinator[dict[str, Any]], ABC):
+    """Base class for coordinators polling one group of Spotify endpoints."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        client: SpotifyStatsClient,
+        name: str,
+        update_interval: timedelta,
+        enabled_sensors: frozenset[str],
+    ) -> None:
+        """Initialize the coordinator."""
+        self.client = client
+        self.username = client.username
+        # Data for sensors that aren't enabled is never fetched
+        self.enabled_sensors = enabled_sensors
+
+        # Transformed payloads keyed by fetcher, with the signature they were built from
+        self._transform_cache: dict[str, tuple[Hashable, dict[str, Any]]] = {}
+
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=name,
+            update_interval=update_interval,
+            # Only notify listeners when the fetched data actually changed
+            always_update=False,
+        )
+
+    async def _async_update_data(self) -> dict[str, Any]:
+        """Fetch data from Spotify API."""
+        await self.client.async_prepare()
+        
+        try:
+            token = self.client.current_token
+            try:
+                return await self._async_fetch_data()
+            except spotipy.exceptions.SpotifyException as err:
+                if err.http_status != 401:
+                    raise
+                # Token was rejected despite looking valid, refresh once inline and retry
+                await self.client.async_handle_unauthorized(token)
+                return await self._async_fetch_data()
 
         except spotipy.exceptions.SpotifyException as err:
             if err.http_status == 401:
                 raise ConfigEntryAuthFailed("Spotify authentication expired") from err
             raise UpdateFailed(f"Error communicating with Spotify API: {err}") from err
+        except (ConfigEntryAuthFailed, UpdateFailed):
+            raise
         except Exception as err:
             raise UpdateFailed(f"Unexpected error: {err}") from err
 
-    def _should_update_followed(self) -> bool:
-        """Check if followed artists should be updated."""
-        if self._last_followed_update is None:
-            return True
+    @abstractmethod
+    async def _async_fetch_data(self) -> dict[str, Any]:
+        """Fetch this coordinator's data, implemented by each coordinator."""
 
-        time_since_update = (
-            dt_util.utcnow() - self._last_followed_update
-        ).total_seconds()
-        return time_since_update >= UPDATE_INTERVAL_FOLLOWED
+    async def _async_gather(
+        self, jobs: list[tuple[str | None, Awaitable[dict[str, Any]]]]
+    ) -> dict[str, Any]:
+        """Run fetch jobs concurrently and merge their results into the data.
 
-    def _should_update_top_stats(self) -> bool:
-        """Check if top stats should be updated."""
-        if self._last_top_stats_update is None:
-            return True
+        Each job maps a data key to its fetch, a key of None means the
+        result holds several keys.
+        """
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        timings: dict[str, float] = {}
+        start = time.perf_counter() if debug else 0.0
+
+        async def timed(key: str, job: Awaitable[dict[str, Any]]) -> dict[str, Any]:
+            job_start = time.perf_counter()
+            try:
+                return await job
+            finally:
+                timings[key] = round(time.perf_counter() - job_start, 3)
+
+        results = await asyncio.gather(
+            *(timed(key or "top_stats", job) if debug else job for key, job in jobs),
+            return_exceptions=True,
+        )
+
+        # An expired token fails every request, let the caller handle it
+        for result in results:
+            if (
+                isinstance(result, spotipy.exceptions.SpotifyException)
+                and result.http_status == 401
+            ):
+                raise result
+
+        # Start from the previous data so anything not refreshed is kept
+        data = dict(self.data) if self.data else {}
+
+        for (key, _), result in zip(jobs, results):
+            if isinstance(result, Exception):
+                # Without earlier data there's nothing to fall back to
+                if self.data is None:
+                    raise result
+                _LOGGER.warning(
+                    "Failed to fetch %s for user %s, keeping previous data: %s",
+                    key or "top stats",
+                    self.username,
+                    result,
+                )
+                continue
+
+            # Keep the previous object for anything unchanged so listeners
+            # can tell by identity that there's nothing to rebuild
+            for data_key, value in (result.items() if key is None else ((key, result),)):
+                previous = data.get(data_key)
+                data[data_key] = previous if previous == value else value
+
+        if debug:
+            _LOGGER.debug(
+                "Updated %s for user %s in %.3fs, timings: %s",
+                self.name,
+                self.username,
+                time.perf_counter() - start,
+                timings,
+            )
+        return data
+
+    def _spotify_get(
+        self, path: str, *, conditional: bool = False, **params: Any
+    ) -> Awaitable[dict[str, Any] | None]:
+        """Issue a GET against the Spotify Web API."""
+        return self.client.async_get(path, conditional=conditional, **params)
+
+    def _memoized(
+        self,
+        key: str,
+        signature: Hashable,
+        transform: Callable[[], dict[str, Any]],
+    ) -> dict[str, Any]:
+        """Return the cached payload for key while its signature is unchanged."""
+        cached = self._transform_cache.get(key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        payload = transform()
+        self._transform_cache[key] = (signature, payload)
+        return payload
+
+
+class SpotifyStatsCoordinator(SpotifyStatsBaseCoordinator):
+    """Coordinator for now playing and recently played, and owner of the others."""
+
+    def __init__(
+        self, hass: HomeAssistant, entry: ConfigEntry, session: OAuth2Session
+    ) -> None:
+        """Initialize the coordinator."""
+        _LOGGER.debug("SpotifyStatsCoordinator.__init__ starting for user: %s", entry.data.get(CONF_USERNAME))
+        
+        self.session = session
+        self.entry = entry
+        # The options this coordinator was built from, services may change the
+        # intervals at runtime without that counting as an options change
+        self._configured_options = _configured_options(entry)
 
-        time_since_update = (
-            dt_util.utcnow() - self._last_top_stats_update
-        ).total_seconds()
-        return time_since_update >= UPDATE_INTERVAL_TOP_STATS
+        # Get update intervals from config
+        self.now_playing_interval = entry.data.get(
+            CONF_NOW_PLAYING_INTERVAL, DEFAULT_NOW_PLAYING_INTERVAL
+        )
+        self.recently_played_interval = entry.data.get(
+            CONF_RECENTLY_PLAYED_INTERVAL, DEFAULT_RECENTLY_PLAYED_INTERVAL
+        )
+        
+        _LOGGER.debug("SpotifyStatsCoordinator: Update intervals - now_playing: %s, recently_played: %s", 
+                     self.now_playing_interval, self.recently_played_interval)
 
-    def _fetch_now_playing(self) -> dict[str, Any]:
+        enabled_sensors = frozenset(entry.data.get(CONF_ENABLED_SENSORS, ALL_SENSORS))
+        client = SpotifyStatsClient(hass, entry, session)
+
+        # Polls follow now playing, recently played is fetched on its own interval
+        self._last_recently_played_update: float | None = None
+        # When the recently played of the refresh in progress was fetched
+        self._recently_played_fetched_at: float | None = None
+
+        super().__init__(
+            hass,
+            client,
+            name=f"{DOMAIN}_{client.username}",
+            update_interval=timedelta(seconds=self.now_playing_interval),
+            enabled_sensors=enabled_sensors,
+        )
+
+        # Slower moving data is polled on its own cadence
+        self.library_coordinator = SpotifyLibraryCoordinator(
+            hass, client, enabled_sensors
+        )
+        self.top_stats_coordinator = SpotifyTopStatsCoordinator(
+            hass, client, enabled_sensors
+        )
+        
+        _LOGGER.debug("SpotifyStatsCoordinator.__init__ completed for user: %s", self.username)
+
+    def options_changed(self, entry: ConfigEntry) -> bool:
+        """Return whether the entry's options differ from those it was built from."""
+        return _configured_options(entry) != self._configured_options
+
+    @property
+    def coordinators(self) -> tuple[SpotifyStatsBaseCoordinator, ...]:
+        """Return all coordinators for this account."""
+        return (self, self.library_coordinator, self.top_stats_coordinator)
+
+    async def _async_update_data(self) -> dict[str, Any]:
+        """Fetch data and schedule the next poll for when the track ends."""
+        # Fall back to the configured interval if the update fails
+        self.update_interval = timedelta(seconds=self.now_playing_interval)
+
+        data = await super()._async_update_data()
+
+        now_playing = data.get(SENSOR_NOW_PLAYING, {})
+        if now_playing.get("is_playing"):
+            remaining = (
+                now_playing["duration_ms"] - now_playing["progress_ms"]
+            ) / 1000 + NOW_PLAYING_TRACK_END_MARGIN
+            if remaining < self.now_playing_interval:
+                self.update_interval = timedelta(
+                    seconds=max(remaining, NOW_PLAYING_TRACK_END_MARGIN)
+                )
+        return data
+
+    async def _async_fetch_data(self) -> dict[str, Any]:
+        """Fetch now playing and recently played."""
+        jobs: list[tuple[str | None, Awaitable[dict[str, Any]]]] = []
+        if SENSOR_NOW_PLAYING in self.enabled_sensors:
+            jobs.append((SENSOR_NOW_PLAYING, self._fetch_now_playing()))
+        else:
+            # Track changes aren't seen, keep the daily top stats refresh going
+            self.top_stats_coordinator.async_invalidate_top_stats()
+        if (
+            SENSOR_RECENTLY_PLAYED in self.enabled_sensors
+            and self._should_update_recently_played()
+        ):
+            jobs.append((SENSOR_RECENTLY_PLAYED, self._fetch_recently_played()))
+
+        self._recently_played_fetched_at = None
+        data = await self._async_gather(jobs)
+        # Only count the fetch once its result is used, a 401 from now playing
+        # discards it and the retry has to fetch it again
+        if self._recently_played_fetched_at is not None:
+            self._last_recently_played_update = self._recently_played_fetched_at
+        return data
+
+    async def _fetch_now_playing(self) -> dict[str, Any]:
         """Fetch currently playing track."""
-        _LOGGER.debug("_fetch_now_playing: Starting fetch")
-        _LOGGER.debug("_fetch_now_playing: Spotify client auth: %s", 
-                     self.sp.auth if hasattr(self.sp, 'auth') else "No auth")
         try:
-            _LOGGER.debug("_fetch_now_playing: Calling current_playback()")
-            current = self.sp.current_playback()
-            _LOGGER.debug("_fetch_now_playing: Got response from Spotify API")
+            current = await self._spotify_get("me/player")
         except spotipy.exceptions.SpotifyException as err:
             _LOGGER.error("_fetch_now_playing: Spotify API error: %s (status: %s)", 
                          err, err.http_status, exc_info=True)
-            _LOGGER.error("_fetch_now_playing: Response body: %s", err.msg if hasattr(err, 'msg') else "No message")
+            _LOGGER.error("_fetch_now_playing: Response body: %s", err.msg)
             raise
         except Exception as err:
             _LOGGER.error("_fetch_now_playing: Unexpected error: %s", err, exc_info=True)
             raise
 
         if not current or not current.get("item"):
-            _LOGGER.debug("_fetch_now_playing: Nothing currently playing")
             return {"state": "idle"}
 
         track = current["item"]
+        # The track details don't change while it plays, only build them once
+        details = self._memoized(
+            SENSOR_NOW_PLAYING,
+            (track["id"], track.get("uri")),
+            partial(_now_playing_track_details, track),
+        )
+
+        # A new track may move the top stats
+        previous = self.data.get(SENSOR_NOW_PLAYING, {}) if self.data else {}
+        if previous.get("track_id") != details["track_id"]:
+            self.top_stats_coordinator.async_invalidate_top_stats()
         return {
             "state": "playing" if current["is_playing"] else "paused",
-            "track_id": track["id"],
-            "track_name": track["name"],
-            "artist_id": track["artists"][0]["id"],
-            "artist_name": track["artists"][0]["name"],
-            "album_name": track["album"]["name"],
-            "album_id": track["album"]["id"],
-            "image_url": track["album"]["images"][0]["url"] if track["album"]["images"] else None,
-            "duration_ms": track["duration_ms"],
+            **details,
             "progress_ms": current.get("progress_ms", 0),
-            "popularity": track.get("popularity", 0),
-            "track_url": track["external_urls"]["spotify"],
             "is_playing": current["is_playing"],
             "shuffle_state": current.get("shuffle_state", False),
             "repeat_state": current.get("repeat_state", "off"),
         }
 
-    def _fetch_recently_played(self) -> dict[str, Any]:
-        """Fetch recently played tracks."""
-        recent = self.sp.current_user_recently_played(limit=20)
-
-        tracks = []
-        for item in recent.get("items", []):
-            track = item["track"]
-            tracks.append({
-                "played_at": item["played_at"],
-                "track_id": track["id"],
-                "track_name": track["name"],
-                "artist_id": track["artists"][0]["id"],
-                "artist_name": track["artists"][0]["name"],
-                "album_name": track["album"]["name"],
-                "album_id": track["album"]["id"],
-                "track_url": track["external_urls"]["spotify"],
-                "duration_ms": track["duration_ms"],
-                "popularity": track.get("popularity", 0),
-                "explicit": track.get("explicit", False),
-            })
-
-        return {
-            "count": len(tracks),
-            "tracks": tracks,
-            "last_played": tracks[0]["played_at"] if tracks else None,
-        }
-
-    def _fetch_followed_artists(self) -> dict[str, Any]:
-        """Fetch followed artists."""
-        results = []
-        after = None
-
-        # Spotify returns max 50 at a time, paginate through all
-        while True:
-            response = self.sp.current_user_followed_artists(limit=50, after=after)
-            artists = response["artists"]
-
-            for artist in artists["items"]:
-                results.append({
-                    "id": artist["id"],
-                    "name": artist["name"],
-                    "url": artist["external_urls"]["spotify"],
-                    "image": artist["images"][0]["url"] if artist["images"] else None,
-                    "genres": artist.get("genres", []),
-                    "popularity": artist.get("popularity", 0),
-                })
-
-            if not artists["next"]:
-                break
-
-            after = artists["cursors"]["after"]
-
-        return {
-            "count": len(results),
-            "artists": results[:20],  # Limit to 20 in sensor attributes
-            "all_artists": results,  # Store all for export
-        }
-
-    def _fetch_top_stats(self) -> dict[str, Any]:
-        """Fetch top artists and tracks for all time ranges."""
-        data = {}
-
-        # Top artists
-        for period, time_range in [
-            ("4weeks", TIME_RANGE_SHORT),
-            ("6months", TIME_RANGE_MEDIUM),
-            ("alltime", TIME_RANGE_LONG),
-        ]:
-            artists = self.sp.current_user_top_artists(limit=50, time_range=time_range)
-            data[f"top_artists_{period}"] = {
-                "count": len(artists["items"]),
-                "period": time_range,
-                "artists": [
-                    {
-                        "id": artist["id"],
-                        "name": artist["name"],
-                        "url": artist["external_urls"]["spotify"],
-                        "rank": idx + 1,
-                        "genres": artist.get("genres", []),
-                        "popularity": artist.get("popularity", 0),
-                    }
-                    for idx, artist in enumerate(artists["items"])
-                ],
-            }
-
-        # Top tracks
-        for period, time_range in [
-            ("4weeks", TIME_RANGE_SHORT),
-            ("6months", TIME_RANGE_MEDIUM),
-            ("alltime", TIME_RANGE_LONG),
-        ]:
-            tracks = self.sp.current_user_top_tracks(limit=50, time_range=time_range)
-            data[f"top_tracks_{period}"] = {
-                "count": len(tracks["items"]),
-                "period": time_range,
-                "tracks": [
-                    {
-                        "id": track["id"],
-                        "name": track["name"],
-                        "artist_name": track["artists"][0]["name"],
-                        "artist_id": track["artists"][0]["id"],
-                        "album_name": track["album"]["name"],
-                        "url": track["external_urls"]["spotify"],
-                        "rank": idx + 1,
-                        "popularity": track.get("popularity", 0),
-                    }
-                    for idx, track in enumerate(tracks["items"])
-                ],
-            }
+    def _should_update_recently_played(self) -> bool:
+        """Check if recently played is due, the previous data is kept until then."""
+        return (
+            self._last_recently_played_update is None
+            or time.monotonic() - self._last_recently_played_update
+            >= self.recently_played_interval
+        )
 
-        return data
+    async def _fetch_recently_played(self) -> dict[str, Any]:
+        """Fetch recently played tracks."""
+        recent = await self._spotify_get(
+            "me/player/recently-played", conditional=True, limit=20
+        )
+        self._recently_played_fetched_at = time.monotonic()
+        items = recent.get("items", [])
 
-    def _fetch_user_playlists(self) -> dict[str, Any]:
-        """Fetch user's playlists."""
-        _LOGGER.debug("_fetch_user_playlists: Starting fetch")
-        
-        try:
-            playlists = []
-            results = self.sp.current_user_playlists(limit=50)
-            
-            while results:
-                for playlist in results["items"]:
-                    playlists.append({
-                        "id": playlist["id"],
-                        "name": playlist["name"],
-                        "url": playlist["external_urls"]["spotify"],
-                        "uri": playlist["uri"],
-                        "tracks_total": playlist["tracks"]["total"],
-                        "description": playlist.get("description", ""),
-                        "public": playlist.get("public", False),
-                        "collaborative": playlist.get("collaborative", False),
-                        "owner": playlist["owner"]["display_name"],
-                        "owner_id": playlist["owner"]["id"],
-                    })
-                
-                # Get next page if available
-                if results["next"]:
-                    results = self.sp.next(results)
-                else:
-                    results = None
-            
-            _LOGGER.debug("_fetch_user_playlists: Found %s playlists", len(playlists))
-            
-            # Store only first 20 in attributes to avoid database size issues
-            playlists_for_attributes = playlists[:20]
-            
-            return {
-                "count": len(playlists),
-                "playlists": playlists_for_attributes,
-                "all_playlists": playlists,  # Keep full list for export services
-            }
-        except Exception as err:
-            _LOGGER.error("_fetch_user_playlists: Error: %s", err, exc_info=True)
-            return {"count": 0, "playlists": [], "all_playlists": []}
+        def transform() -> dict[str, Any]:
+            tracks = [_recent_track_row(item) for item in items]
 
-    def _fetch_saved_tracks(self) -> dict[str, Any]:
-        """Fetch user's saved tracks."""
-        _LOGGER.debug("_fetch_saved_tracks: Starting fetch")
-        
-        try:
-            # Get total count first
-            results = self.sp.current_user_saved_tracks(limit=1)
-            total_count = results["total"]
-            
-            # Fetch first 50 tracks with details
-            tracks = []
-            results = self.sp.current_user_saved_tracks(limit=50)
-            
-            for item in results["items"]:
-                track = item.get("track")
-                
-                # Skip if track is None (deleted/unavailable)
-                if not track:
-                    _LOGGER.warning("Skipping saved track with no data (possibly deleted)")
-                    continue
-                
-                # Skip if track doesn't have required fields
-                if not track.get("id") or not track.get("artists") or not track.get("album"):
-                    _LOGGER.warning("Skipping track with missing data: %s", track.get("name", "Unknown"))
-                    continue
-                
-                try:
-                    tracks.append({
-                        "id": track["id"],
-                        "name": track.get("name", "Unknown Track"),
-                        "artist_name": track["artists"][0]["name"],
-                        "artist_id": track["artists"][0]["id"],
-                        "album_name": track["album"]["name"],
-                        "album_id": track["album"]["id"],
-                        "url": track["external_urls"]["spotify"],
-                        "uri": track.get("uri", ""),
-                        "duration_ms": track.get("duration_ms", 0),
-                        "popularity": track.get("popularity", 0),
-                        "added_at": item.get("added_at", ""),
-                    })
-                except (KeyError, IndexError, TypeError) as err:
-                    _LOGGER.warning("Error processing track %s: %s", track.get("name", "Unknown"), err)
-                    continue
-            
-            _LOGGER.debug("_fetch_saved_tracks: Total %s tracks, fetched %s", total_count, len(tracks))
-            
-            # Store only first 20 in attributes to avoid database size issues
-            tracks_for_attributes = tracks[:20]
-            
             return {
-                "count": total_count,
-                "tracks": tracks_for_attributes,
+                "count": len(tracks),
+                "tracks": tracks,
+                "last_played": tracks[0]["played_at"] if tracks else None,
             }
-        except Exception as err:
-            _LOGGER.error("_fetch_saved_tracks: Error: %s", err, exc_info=True)
-            return {"count": 0, "tracks": []}
 
-    def _fetch_saved_albums(self) -> dict[str, Any]:
-        """Fetch user's saved albums."""
-        _LOGGER.debug("_fetch_saved_albums: Starting fetch")
-        
-        try:
-            # Get total count first
-            results = self.sp.current_user_saved_albums(limit=1)
-            total_count = results["total"]
-            
-            # Fetch first 50 albums with details
-            albums = []
-            results = self.sp.current_user_saved_albums(limit=50)
-            
-            for item in results["items"]:
-                album = item.get("album")
-                
-                # Skip if album is None (deleted/unavailable)
-                if not album:
-                    _LOGGER.warning("Skipping saved album with no data (possibly deleted)")
-                    continue
-                
-                # Skip if album doesn't have required fields
-                if not album.get("id") or not album.get("artists"):
-                    _LOGGER.warning("Skipping album with missing data: %s", album.get("name", "Unknown"))
-                    continue
-                
-                try:
-                    albums.append({
-                        "id": album["id"],
-                        "name": album.get("name", "Unknown Album"),
-                        "artist_name": album["artists"][0]["name"],
-                        "artist_id": album["artists"][0]["id"],
-                        "url": album["external_urls"]["spotify"],
-                        "uri": album.get("uri", ""),
-                        "total_tracks": album.get("total_tracks", 0),
-                        "release_date": album.get("release_date", ""),
-                        "added_at": item.get("added_at", ""),
-                    })
-                except (KeyError, IndexError, TypeError) as err:
-                    _LOGGER.warning("Error processing album %s: %s", album.get("name", "Unknown"), err)
-                    continue
-            
-            _LOGGER.debug("_fetch_saved_albums: Total %s albums, fetched %s", total_count, len(albums))
-            
-            # Store only first 20 in attributes to avoid database size issues
-            albums_for_attributes = albums[:20]
-            
-            return {
-                "count": total_count,
-                "albums": albums_for_attributes,
-            }
-        except Exception as err:
-            _LOGGER.error("_fetch_saved_albums: Error: %s", err, exc_info=True)
-            return {"count": 0, "albums": []}
+        # A play is identified by when it happened and what was played
+        signature = tuple((item["played_at"], item["track"]["id"]) for item in items)
+        return self._memoized(SENSOR_RECENTLY_PLAYED, signature, transform)
 
     async def async_set_update_interval(
         self, now_playing: int | None = None, recently_played: int | None = None
@@ -562,18 +793,16 @@ class SpotifyStatsCoordinator(DataUpdateCoordinator):
 
         if recently_played is not None:
             self.recently_played_interval = recently_played
+            # Apply the new interval from this refresh on
+            self._last_recently_played_update = None
             _LOGGER.debug(
                 "Updated recently_played interval to %s seconds for user %s",
                 recently_played,
                 self.username,
             )
 
-        # Update the coordinator's update interval to the shorter of the two
-        min_interval = min(
-            self.now_playing_interval,
-            self.recently_played_interval,
-        )
-        self.update_interval = timedelta(seconds=min_interval)
+        # Recently played is gated separately, polls follow now playing
+        self.update_interval = timedelta(seconds=self.now_playing_interval)
 
         # Trigger an immediate update
         await self.async_request_refresh()
@@ -581,3 +810,264 @@ class SpotifyStatsCoordinator(DataUpdateCoordinator):
     async def async_shutdown(self) -> None:
         """Clean up resources."""
         _LOGGER.debug("Shutting down coordinator for user: %s", self.username)
+        await self.library_coordinator.async_shutdown()
+        await self.top_stats_coordinator.async_shutdown()
+        await super().async_shutdown()
+        await self.client.async_close()
+
+
+class SpotifyLibraryCoordinator(SpotifyStatsBaseCoordinator):
+    """Coordinator for playlists and the saved library."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        client: SpotifyStatsClient,
+        enabled_sensors: frozenset[str],
+    ) -> None:
+        """Initialize the coordinator."""
+        super().__init__(
+            hass,
+            client,
+            name=f"{DOMAIN}_{client.username}_library",
+            update_interval=timedelta(seconds=UPDATE_INTERVAL_LIBRARY),
+            enabled_sensors=enabled_sensors,
+        )
+
+    async def _async_fetch_data(self) -> dict[str, Any]:
+        """Fetch playlists, saved tracks and saved albums."""
+        fetchers = (
+            (SENSOR_USER_PLAYLISTS, self._fetch_user_playlists),
+            (SENSOR_SAVED_TRACKS, self._fetch_saved_tracks),
+            (SENSOR_SAVED_ALBUMS, self._fetch_saved_albums),
+        )
+        return await self._async_gather(
+            [
+                (key, fetch())
+                for key, fetch in fetchers
+                if key in self.enabled_sensors
+            ]
+        )
+
+    async def _fetch_user_playlists(self) -> dict[str, Any]:
+        """Fetch user's playlists."""
+        # Only the first 20 are kept in attributes, the page reports the total
+        results = await self._spotify_get("me/playlists", limit=20)
+        items = results["items"]
+
+        def transform() -> dict[str, Any]:
+            return {
+                "count": results["total"],
+                "playlists": [_playlist_row(playlist) for playlist in items],
+            }
+
+        # Spotify changes the snapshot id whenever a playlist is modified
+        signature = (
+            results["total"],
+            tuple(
+                (playlist["id"], playlist["snapshot_id"], playlist["tracks"]["total"])
+                for playlist in items
+            ),
+        )
+        return self._memoized(SENSOR_USER_PLAYLISTS, signature, transform)
+
+    async def _fetch_saved_tracks(self) -> dict[str, Any]:
+        """Fetch user's saved tracks."""
+        # The first 50 tracks with details, the page also reports the total
+        results = await self._spotify_get(
+            "me/tracks", conditional=True, limit=50
+        )
+        total_count = results["total"]
+
+        def transform() -> dict[str, Any]:
+            # Store only first 20 in attributes to avoid database size
+            # issues, so only shape entries until 20 usable ones are found
+            rows = (
+                row
+                for item in results["items"]
+                if (row := _saved_track_row(item)) is not None
+            )
+
+            return {
+                "count": total_count,
+                "tracks": list(islice(rows, 20)),
+            }
+
+        signature = (
+            total_count,
+            tuple(
+                (item.get("added_at"), (item.get("track") or {}).get("id"))
+                for item in results["items"]
+            ),
+        )
+        return self._memoized(SENSOR_SAVED_TRACKS, signature, transform)
+
+    async def _fetch_saved_albums(self) -> dict[str, Any]:
+        """Fetch user's saved albums."""
+        # The first 50 albums with details, the page also reports the total
+        results = await self._spotify_get(
+            "me/albums", conditional=True, limit=50
+        )
+        total_count = results["total"]
+
+        def transform() -> dict[str, Any]:
+            # Store only first 20 in attributes to avoid database size
+            # issues, so only shape entries until 20 usable ones are found
+            rows = (
+                row
+                for item in results["items"]
+                if (row := _saved_album_row(item)) is not None
+            )
+
+            return {
+                "count": total_count,
+                "albums": list(islice(rows, 20)),
+            }
+
+        signature = (
+            total_count,
+            tuple(
+                (item.get("added_at"), (item.get("album") or {}).get("id"))
+                for item in results["items"]
+            ),
+        )
+        return self._memoized(SENSOR_SAVED_ALBUMS, signature, transform)
+
+
+class SpotifyTopStatsCoordinator(SpotifyStatsBaseCoordinator):
+    """Coordinator for followed artists (hourly) and top stats (daily)."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        client: SpotifyStatsClient,
+        enabled_sensors: frozenset[str],
+    ) -> None:
+        """Initialize the coordinator."""
+        super().__init__(
+            hass,
+            client,
+            name=f"{DOMAIN}_{client.username}_top_stats",
+            update_interval=timedelta(seconds=UPDATE_INTERVAL_FOLLOWED),
+            enabled_sensors=enabled_sensors,
+        )
+
+        # Track when top stats were last fetched, and whether anything was
+        # played since then that could have changed them
+        self._last_top_stats_update: float | None = None
+        self._top_stats_dirty = True
+
+        # The (key, kind, time range) of each top list with an enabled sensor
+        self._top_stats_lists = [
+            (key, kind, time_range)
+            for time_range, artists_key, tracks_key in _TOP_STATS_PERIODS
+            for key, kind in ((artists_key, "artists"), (tracks_key, "tracks"))
+            if key in enabled_sensors
+        ]
+
+    async def _async_fetch_data(self) -> dict[str, Any]:
+        """Fetch followed artists, and top stats at most once a day."""
+        jobs: list[tuple[str | None, Awaitable[dict[str, Any]]]] = []
+        if SENSOR_FOLLOWED_ARTISTS in self.enabled_sensors:
+            jobs.append((SENSOR_FOLLOWED_ARTISTS, self._fetch_followed_artists()))
+
+        # Update top stats daily, if something was played
+        if self._top_stats_lists and self._should_update_top_stats():
+            jobs.append((None, self._fetch_top_stats()))
+
+        return await self._async_gather(jobs)
+
+    def _should_update_top_stats(self) -> bool:
+        """Check if top stats should be updated."""
+        return self._last_top_stats_update is None or (
+            self._top_stats_dirty
+            and time.monotonic() - self._last_top_stats_update
+            >= UPDATE_INTERVAL_TOP_STATS
+        )
+
+    @callback
+    def async_invalidate_top_stats(self) -> None:
+        """Mark top stats as stale after a new track started playing."""
+        self._top_stats_dirty = True
+
+    async def _fetch_followed_artists(self) -> dict[str, Any]:
+        """Fetch followed artists."""
+        # Sensor attributes only hold 20 artists, the page reports the total
+        artists = (
+            await self._spotify_get(
+                "me/following", conditional=True, type="artist", limit=20
+            )
+        )["artists"]
+
+        return {
+            "count": artists["total"],
+            "artists": [_followed_artist_row(artist) for artist in artists["items"]],
+        }
+
+    async def async_get_all_followed_artists(self) -> list[dict[str, Any]]:
+        """Fetch every followed artist, for the export service."""
+        await self.client.async_prepare()
+
+        results = []
+
+        # Spotify returns max 50 at a time behind a cursor, so pages can't be
+        # requested up front. Fetch the next page while processing this one.
+        next_page = asyncio.create_task(
+            self.client.async_export_get("me/following", type="artist", limit=50)
+        )
+        try:
+            while next_page is not None:
+                artists = (await next_page)["artists"]
+
+                next_page = None
+                if artists["next"]:
+                    next_page = asyncio.create_task(
+                        self.client.async_export_get(
+                            "me/following",
+                            type="artist",
+                            limit=50,
+                            after=artists["cursors"]["after"],
+                        )
+                    )
+
+                results.extend(
+                    [_followed_artist_row(artist) for artist in artists["items"]]
+                )
+        finally:
+            # Don't leave a prefetched page running if processing failed
+            if next_page is not None:
+                next_page.cancel()
+
+        return results
+
+    async def _fetch_top_list(self, kind: str, time_range: str) -> dict[str, Any]:
+        """Fetch the top artists or tracks for one time range."""
+        items = (
+            await self._spotify_get(f"me/top/{kind}", limit=50, time_range=time_range)
+        )["items"]
+        row = _top_artist_row if kind == "artists" else _top_track_row
+
+        return {
+            "count": len(items),
+            "period": time_range,
+            kind: [row(rank, item) for rank, item in enumerate(items, 1)],
+        }
+
+    async def _fetch_top_stats(self) -> dict[str, Any]:
+        """Fetch the enabled top artists and tracks lists."""
+        lists = self._top_stats_lists
+
+        # Plays from now on count towards the next refresh
+        self._top_stats_dirty = False
+        try:
+            # The requests are independent, so issue them concurrently
+            results = await asyncio.gather(
+                *(self._fetch_top_list(kind, time_range) for _, kind, time_range in lists)
+            )
+        except BaseException:
+            self._top_stats_dirty = True
+            raise
+        data = {key: result for (key, _, _), result in zip(lists, results)}
+
+        self._last_top_stats_update = time.monotonic()
+        return data
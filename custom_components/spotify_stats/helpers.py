@@ -0,0 +1,12 @@
+"""Helpers shared across the Spotify Statistics integration."""
+from __future__ import annotations
+
+from functools import lru_cache
+
+_SANITIZE_TRANS = str.maketrans({" ": "_", "-": "_"})
+
+
+@lru_cache(maxsize=128)
+def sanitize_username(username: str) -> str:
+    """Convert username to valid entity ID format."""
+    return username.lower().translate(_SANITIZE_TRANS)
@@ -1,13 +1,14 @@
 """Sensor platform for Spotify Statistics."""
 from __future__ import annotations
 
+from abc import ABC, abstractmethod
 from datetime import datetime
 import logging
 from typing import Any
 
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -28,16 +29,11 @@ from .const import (
     SENSOR_TOP_TRACKS_ALLTIME,
     SENSOR_USER_PLAYLISTS,
 )
-from .coordinator import SpotifyStatsCoordinator
+from .coordinator import SpotifyStatsBaseCoordinator, SpotifyStatsCoordinator
+from .helpers import sanitize_username
 
 _LOGGER = logging.getLogger(__name__)
 
-
-def sanitize_username(username: str) -> str:
-    """Convert username to valid entity ID format."""
-    return username.lower().replace(" ", "_").replace("-", "_")
-
-
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -47,38 +43,79 @@ async def async_setup_entry(
     coordinator: SpotifyStatsCoordinator = hass.data[DOMAIN][entry.entry_id]
     username = entry.data[CONF_USERNAME]
     
+    library = coordinator.library_coordinator
+    top_stats = coordinator.top_stats_coordinator
+    
+    sensor_types = (
+        (SENSOR_NOW_PLAYING, SpotifyNowPlayingSensor, coordinator, ()),
+        (SENSOR_RECENTLY_PLAYED, SpotifyRecentlyPlayedSensor, coordinator, ()),
+        (SENSOR_FOLLOWED_ARTISTS, SpotifyFollowedArtistsSensor, top_stats, ()),
+        (SENSOR_TOP_ARTISTS_4WEEKS, SpotifyTopArtistsSensor, top_stats, ("4weeks",)),
+        (SENSOR_TOP_ARTISTS_6MONTHS, SpotifyTopArtistsSensor, top_stats, ("6months",)),
+        (SENSOR_TOP_ARTISTS_ALLTIME, SpotifyTopArtistsSensor, top_stats, ("alltime",)),
+        (SENSOR_TOP_TRACKS_4WEEKS, SpotifyTopTracksSensor, top_stats, ("4weeks",)),
+        (SENSOR_TOP_TRACKS_6MONTHS, SpotifyTopTracksSensor, top_stats, ("6months",)),
+        (SENSOR_TOP_TRACKS_ALLTIME, SpotifyTopTracksSensor, top_stats, ("alltime",)),
+        (SENSOR_USER_PLAYLISTS, SpotifyUserPlaylistsSensor, library, ()),
+        (SENSOR_SAVED_TRACKS, SpotifySavedTracksSensor, library, ()),
+        (SENSOR_SAVED_ALBUMS, SpotifySavedAlbumsSensor, library, ()),
+    )
+    
+    # Only create the sensors selected in the options
     sensors = [
-        SpotifyNowPlayingSensor(coordinator, username),
-        SpotifyRecentlyPlayedSensor(coordinator, username),
-        SpotifyFollowedArtistsSensor(coordinator, username),
-        SpotifyTopArtistsSensor(coordinator, username, "4weeks"),
-        SpotifyTopArtistsSensor(coordinator, username, "6months"),
-        SpotifyTopArtistsSensor(coordinator, username, "alltime"),
-        SpotifyTopTracksSensor(coordinator, username, "4weeks"),
-        SpotifyTopTracksSensor(coordinator, username, "6months"),
-        SpotifyTopTracksSensor(coordinator, username, "alltime"),
-        SpotifyUserPlaylistsSensor(coordinator, username),
-        SpotifySavedTracksSensor(coordinator, username),
-        SpotifySavedAlbumsSensor(coordinator, username),
+        sensor_cls(sensor_coordinator, username, *args)
+        for key, sensor_cls, sensor_coordinator, args in sensor_types
+        if key in coordinator.enabled_sensors
     ]
     
     async_add_entities(sensors)
     _LOGGER.debug("Added %s Spotify sensors for user: %s", len(sensors), username)
 
 
-class SpotifyStatsBaseSensor(CoordinatorEntity, SensorEntity):
-    """Base class for Spotify Statistics sensors."""
+class SpotifyStatsBaseSensor(CoordinatorEntity, SensorEntity, ABC):
+    """Base class for Spotify Statistics sensors.
+
+    State and attributes are built once per coordinator update from the
+    sensor's entry in the coordinator data, not on every state read.
+    """
+
+    _data_key: str
 
     def __init__(
         self,
-        coordinator: SpotifyStatsCoordinator,
+        coordinator: SpotifyStatsBaseCoordinator,
         username: str,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
         self.username = username
         self._sanitized_username = sanitize_username(username)
-        
+        self._last_data: dict[str, Any] | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Build the initial state when added to Home Assistant."""
+        self._update_from_data()
+        await super().async_added_to_hass()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Rebuild the state from fresh coordinator data."""
+        self._update_from_data()
+        super()._handle_coordinator_update()
+
+    def _update_from_data(self) -> None:
+        """Update the state and attributes from the coordinator data."""
+        data = self.coordinator.data.get(self._data_key, {})
+        # The coordinator hands back the same object when this entry is unchanged
+        if data is self._last_data:
+            return
+        self._last_data = data
+        self._update_attrs(data)
+
+    @abstractmethod
+    def _update_attrs(self, data: dict[str, Any]) -> None:
+        """Set the native value and attributes, implemented by each sensor."""
+
     @property
     def device_info(self) -> DeviceInfo:
         """Return device information."""
@@ -93,66 +130,45 @@ class SpotifyStatsBaseSensor(CoordinatorEntity, SensorEntity):
 class SpotifyNowPlayingSensor(SpotifyStatsBaseSensor):
     """Sensor for currently playing track."""
 
-    def __init__(self, coordinator: SpotifyStatsCoordinator, username: str) -> None:
+    _data_key = SENSOR_NOW_PLAYING
+
+    def __init__(self, coordinator: SpotifyStatsBaseCoordinator, username: str) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, username)
         self._attr_name = f"{username} Spotify Stats Now Playing"
         self._attr_unique_id = f"{self._sanitized_username}_spotify_stats_now_playing"
         self._attr_icon = "mdi:spotify"
 
-    @property
-    def native_value(self) -> str:
-        """Return the state of the sensor."""
-        data = self.coordinator.data.get(SENSOR_NOW_PLAYING, {})
-        return data.get("state", "idle")
+    def _update_attrs(self, data: dict[str, Any]) -> None:
+        """Set the playback state and track attributes."""
+        self._attr_native_value = data.get("state", "idle")
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional attributes."""
-        data = self.coordinator.data.get(SENSOR_NOW_PLAYING, {})
-        
-        if data.get("state") == "idle":
-            return {"state": "idle"}
-        
-        return {
-            "track_id": data.get("track_id"),
-            "track_name": data.get("track_name"),
-            "artist_id": data.get("artist_id"),
-            "artist_name": data.get("artist_name"),
-            "album_name": data.get("album_name"),
-            "album_id": data.get("album_id"),
-            "image_url": data.get("image_url"),
-            "duration_ms": data.get("duration_ms"),
-            "progress_ms": data.get("progress_ms"),
-            "popularity": data.get("popularity"),
-            "track_url": data.get("track_url"),
-            "is_playing": data.get("is_playing"),
-            "shuffle_state": data.get("shuffle_state"),
-            "repeat_state": data.get("repeat_state"),
+        if self._attr_native_value == "idle":
+            self._attr_extra_state_attributes = {"state": "idle"}
+            return
+
+        # The coordinator already shapes the payload, pass it through
+        self._attr_extra_state_attributes = {
+            key: value for key, value in data.items() if key != "state"
         }
 
 
 class SpotifyRecentlyPlayedSensor(SpotifyStatsBaseSensor):
     """Sensor for recently played tracks."""
 
-    def __init__(self, coordinator: SpotifyStatsCoordinator, username: str) -> None:
+    _data_key = SENSOR_RECENTLY_PLAYED
+
+    def __init__(self, coordinator: SpotifyStatsBaseCoordinator, username: str) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, username)
         self._attr_name = f"{username} Spotify Stats Recently Played"
         self._attr_unique_id = f"{self._sanitized_username}_spotify_stats_recently_played"
         self._attr_icon = "mdi:history"
 
-    @property
-    def native_value(self) -> str | None:
-        """Return the timestamp of the most recent track."""
-        data = self.coordinator.data.get(SENSOR_RECENTLY_PLAYED, {})
-        return data.get("last_played")
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional attributes."""
-        data = self.coordinator.data.get(SENSOR_RECENTLY_PLAYED, {})
-        return {
+    def _update_attrs(self, data: dict[str, Any]) -> None:
+        """Set the timestamp of the most recent track and the track list."""
+        self._attr_native_value = data.get("last_played")
+        self._attr_extra_state_attributes = {
             "count": data.get("count", 0),
             "tracks": data.get("tracks", []),
         }
@@ -161,24 +177,19 @@ class SpotifyRecentlyPlayedSensor(SpotifyStatsBaseSensor):
 class SpotifyFollowedArtistsSensor(SpotifyStatsBaseSensor):
     """Sensor for followed artists."""
 
-    def __init__(self, coordinator: SpotifyStatsCoordinator, username: str) -> None:
+    _data_key = SENSOR_FOLLOWED_ARTISTS
+
+    def __init__(self, coordinator: SpotifyStatsBaseCoordinator, username: str) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, username)
         self._attr_name = f"{username} Spotify Stats Followed Artists"
         self._attr_unique_id = f"{self._sanitized_username}_spotify_stats_followed_artists"
         self._attr_icon = "mdi:account-music"
 
-    @property
-    def native_value(self) -> int:
-        """Return the count of followed artists."""
-        data = self.coordinator.data.get(SENSOR_FOLLOWED_ARTISTS, {})
-        return data.get("count", 0)
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional attributes."""
-        data = self.coordinator.data.get(SENSOR_FOLLOWED_ARTISTS, {})
-        return {
+    def _update_attrs(self, data: dict[str, Any]) -> None:
+        """Set the count of followed artists and the artist list."""
+        self._attr_native_value = data.get("count", 0)
+        self._attr_extra_state_attributes = {
             "artists": data.get("artists", []),  # Limited to 20
             "total_count": data.get("count", 0),
         }
@@ -188,28 +199,22 @@ class SpotifyTopArtistsSensor(SpotifyStatsBaseSensor):
     """Sensor for top artists."""
 
     def __init__(
-        self, coordinator: SpotifyStatsCoordinator, username: str, period: str
+        self, coordinator: SpotifyStatsBaseCoordinator, username: str, period: str
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, username)
         self.period = period
+        self._data_key = f"top_artists_{period}"
         self._attr_name = f"{username} Spotify Stats Top Artists {period.title()}"
         self._attr_unique_id = (
             f"{self._sanitized_username}_spotify_stats_top_artists_{period}"
         )
         self._attr_icon = "mdi:trophy"
 
-    @property
-    def native_value(self) -> int:
-        """Return the count of top artists."""
-        data = self.coordinator.data.get(f"top_artists_{self.period}", {})
-        return data.get("count", 0)
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional attributes."""
-        data = self.coordinator.data.get(f"top_artists_{self.period}", {})
-        return {
+    def _update_attrs(self, data: dict[str, Any]) -> None:
+        """Set the count of top artists and the ranked list."""
+        self._attr_native_value = data.get("count", 0)
+        self._attr_extra_state_attributes = {
             "period": data.get("period"),
             "artists": data.get("artists", []),
         }
@@ -219,28 +224,22 @@ class SpotifyTopTracksSensor(SpotifyStatsBaseSensor):
     """Sensor for top tracks."""
 
     def __init__(
-        self, coordinator: SpotifyStatsCoordinator, username: str, period: str
+        self, coordinator: SpotifyStatsBaseCoordinator, username: str, period: str
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, username)
         self.period = period
+        self._data_key = f"top_tracks_{period}"
         self._attr_name = f"{username} Spotify Stats Top Tracks {period.title()}"
         self._attr_unique_id = (
             f"{self._sanitized_username}_spotify_stats_top_tracks_{period}"
         )
         self._attr_icon = "mdi:music-note"
 
-    @property
-    def native_value(self) -> int:
-        """Return the count of top tracks."""
-        data = self.coordinator.data.get(f"top_tracks_{self.period}", {})
-        return data.get("count", 0)
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional attributes."""
-        data = self.coordinator.data.get(f"top_tracks_{self.period}", {})
-        return {
+    def _update_attrs(self, data: dict[str, Any]) -> None:
+        """Set the count of top tracks and the ranked list."""
+        self._attr_native_value = data.get("count", 0)
+        self._attr_extra_state_attributes = {
             "period": data.get("period"),
             "tracks": data.get("tracks", []),
         }
@@ -249,24 +248,19 @@ class SpotifyTopTracksSensor(SpotifyStatsBaseSensor):
 class SpotifyUserPlaylistsSensor(SpotifyStatsBaseSensor):
     """Sensor for user playlists."""
 
-    def __init__(self, coordinator: SpotifyStatsCoordinator, username: str) -> None:
+    _data_key = SENSOR_USER_PLAYLISTS
+
+    def __init__(self, coordinator: SpotifyStatsBaseCoordinator, username: str) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, username)
         self._attr_name = f"{username} Spotify Stats Playlists"
         self._attr_unique_id = f"{self._sanitized_username}_spotify_stats_playlists"
         self._attr_icon = "mdi:playlist-music"
 
-    @property
-    def native_value(self) -> int:
-        """Return the count of playlists."""
-        data = self.coordinator.data.get(SENSOR_USER_PLAYLISTS, {})
-        return data.get("count", 0)
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional attributes."""
-        data = self.coordinator.data.get(SENSOR_USER_PLAYLISTS, {})
-        return {
+    def _update_attrs(self, data: dict[str, Any]) -> None:
+        """Set the count of playlists and the first entries."""
+        self._attr_native_value = data.get("count", 0)
+        self._attr_extra_state_attributes = {
             "playlists": data.get("playlists", []),
         }
 
@@ -274,24 +268,19 @@ class SpotifyUserPlaylistsSensor(SpotifyStatsBaseSensor):
 class SpotifySavedTracksSensor(SpotifyStatsBaseSensor):
     """Sensor for saved tracks."""
 
-    def __init__(self, coordinator: SpotifyStatsCoordinator, username: str) -> None:
+    _data_key = SENSOR_SAVED_TRACKS
+
+    def __init__(self, coordinator: SpotifyStatsBaseCoordinator, username: str) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, username)
         self._attr_name = f"{username} Spotify Stats Saved Tracks"
         self._attr_unique_id = f"{self._sanitized_username}_spotify_stats_saved_tracks"
         self._attr_icon = "mdi:heart"
 
-    @property
-    def native_value(self) -> int:
-        """Return the count of saved tracks."""
-        data = self.coordinator.data.get(SENSOR_SAVED_TRACKS, {})
-        return data.get("count", 0)
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional attributes."""
-        data = self.coordinator.data.get(SENSOR_SAVED_TRACKS, {})
-        return {
+    def _update_attrs(self, data: dict[str, Any]) -> None:
+        """Set the count of saved tracks and the first entries."""
+        self._attr_native_value = data.get("count", 0)
+        self._attr_extra_state_attributes = {
             "tracks": data.get("tracks", []),
         }
 
@@ -299,23 +288,18 @@ class SpotifySavedTracksSensor(SpotifyStatsBaseSensor):
 class SpotifySavedAlbumsSensor(SpotifyStatsBaseSensor):
     """Sensor for saved albums."""
 
-    def __init__(self, coordinator: SpotifyStatsCoordinator, username: str) -> None:
+    _data_key = SENSOR_SAVED_ALBUMS
+
+    def __init__(self, coordinator: SpotifyStatsBaseCoordinator, username: str) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, username)
         self._attr_name = f"{username} Spotify Stats Saved Albums"
         self._attr_unique_id = f"{self._sanitized_username}_spotify_stats_saved_albums"
         self._attr_icon = "mdi:album"
 
-    @property
-    def native_value(self) -> int:
-        """Return the count of saved albums."""
-        data = self.coordinator.data.get(SENSOR_SAVED_ALBUMS, {})
-        return data.get("count", 0)
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional attributes."""
-        data = self.coordinator.data.get(SENSOR_SAVED_ALBUMS, {})
-        return {
+    def _update_attrs(self, data: dict[str, Any]) -> None:
+        """Set the count of saved albums and the first entries."""
+        self._attr_native_value = data.get("count", 0)
+        self._attr_extra_state_attributes = {
             "albums": data.get("albums", []),
         }
@@ -1,19 +1,25 @@
 """Services for Spotify Statistics integration."""
 from __future__ import annotations
 
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable
 import csv
-import json
+from functools import wraps
+import io
 import logging
 import os
 from pathlib import Path
+import time
 from typing import Any
 
+import orjson
 import spotipy
 import voluptuous as vol
 
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.helpers import config_validation as cv
 from homeassistant.util import dt as dt_util
+from homeassistant.util.file import write_utf8_file_atomic
 
 from .const import (
     ATTR_APPEND,
@@ -36,31 +42,70 @@ from .const import (
     TIME_RANGE_MEDIUM,
     TIME_RANGE_SHORT,
 )
-from .coordinator import SpotifyStatsCoordinator
+from .coordinator import SpotifyStatsClient, SpotifyStatsCoordinator
+from .helpers import sanitize_username
 
 _LOGGER = logging.getLogger(__name__)
 
-# Service schemas
-EXPORT_FOLLOWED_ARTISTS_SCHEMA = vol.Schema(
-    {
-        vol.Required(ATTR_USERNAME): cv.string,
-        vol.Required(ATTR_FILEPATH): cv.string,
-    }
+_ARTISTS_BATCH_SIZE = 50
+_ARTIST_CACHE_TTL = 86400  # seconds, artist metadata changes rarely
+_PAGE_SIZE = 50
+_AUDIO_FEATURES_BATCH_SIZE = 100
+
+# Retries for export requests that were rate limited or hit a server error
+_RETRY_ATTEMPTS = 4
+_RETRY_BASE_DELAY = 1.0  # seconds, doubled on every attempt
+_RETRY_MAX_DELAY = 60  # seconds, give up rather than wait longer
+
+# CSV export columns
+_RECENT_COLUMNS = (
+    "username",
+    "played_at",
+    "track_id",
+    "track_name",
+    "artist_id",
+    "artist_name",
+    "album_name",
+    "album_id",
+    "duration_ms",
+    "popularity",
+    "explicit",
+    "track_url",
 )
-
-EXPORT_SAVED_LIBRARY_SCHEMA = vol.Schema(
-    {
-        vol.Required(ATTR_USERNAME): cv.string,
-        vol.Required(ATTR_FILEPATH): cv.string,
-    }
+_AUDIO_COLUMNS = (
+    "danceability",
+    "energy",
+    "key",
+    "loudness",
+    "mode",
+    "speechiness",
+    "acousticness",
+    "instrumentalness",
+    "liveness",
+    "valence",
+    "tempo",
 )
+_RECENT_AUDIO_COLUMNS = _RECENT_COLUMNS + _AUDIO_COLUMNS
+_TOP_ARTIST_COLUMNS = (
+    "username", "export_date", "rank", "id", "name", "url", "genres", "popularity"
+)
+_TOP_TRACK_COLUMNS = (
+    "username", "export_date", "rank", "id", "name",
+    "artist_name", "artist_id", "album_name", "url", "popularity",
+)
+
+# Audio features merged into recently played exports
+_AUDIO_KEYS = frozenset(_AUDIO_COLUMNS)
 
-EXPORT_PLAYLISTS_SCHEMA = vol.Schema(
+# Service schemas, the JSON exports all take the same fields
+EXPORT_FOLLOWED_ARTISTS_SCHEMA = vol.Schema(
     {
         vol.Required(ATTR_USERNAME): cv.string,
         vol.Required(ATTR_FILEPATH): cv.string,
     }
 )
+EXPORT_SAVED_LIBRARY_SCHEMA = EXPORT_FOLLOWED_ARTISTS_SCHEMA
+EXPORT_PLAYLISTS_SCHEMA = EXPORT_FOLLOWED_ARTISTS_SCHEMA
 
 EXPORT_RECENTLY_PLAYED_CSV_SCHEMA = vol.Schema(
     {
@@ -99,46 +144,53 @@ REFRESH_NOW_PLAYING_SCHEMA = vol.Schema(
 )
 
 
-def sanitize_username(username: str) -> str:
-    """Convert username to valid format."""
-    return username.lower().replace(" ", "_").replace("-", "_")
-
-
 def get_coordinator_for_username(
     hass: HomeAssistant, username: str
 ) -> SpotifyStatsCoordinator | None:
     """Get coordinator for a specific username."""
-    sanitized = sanitize_username(username)
-    
-    for entry_id, coordinator in hass.data[DOMAIN].items():
-        if sanitize_username(coordinator.username) == sanitized:
-            return coordinator
-    
-    _LOGGER.error("No coordinator found for username: %s", username)
-    return None
+    # Coordinators are indexed by sanitized username as entries are set up
+    coordinator = hass.data[DOMAIN].get("_by_username", {}).get(
+        sanitize_username(username)
+    )
+    if coordinator is None:
+        _LOGGER.error("No coordinator found for username: %s", username)
+    return coordinator
 
 
 async def async_setup_services(hass: HomeAssistant) -> None:
     """Set up services for Spotify Statistics."""
 
-    async def export_followed_artists(call: ServiceCall) -> None:
+    def requires_coordinator(
+        handler: Callable[[SpotifyStatsCoordinator, ServiceCall], Awaitable[None]],
+    ) -> Callable[[ServiceCall], Awaitable[None]]:
+        """Pass the handler the coordinator of the call's account."""
+
+        @wraps(handler)
+        async def handle_call(call: ServiceCall) -> None:
+            coordinator = get_coordinator_for_username(hass, call.data[ATTR_USERNAME])
+            if coordinator is None:
+                return  # The lookup already logged it
+            await handler(coordinator, call)
+
+        return handle_call
+
+    @requires_coordinator
+    async def export_followed_artists(
+        coordinator: SpotifyStatsCoordinator, call: ServiceCall
+    ) -> None:
         """Export followed artists to JSON."""
         username = call.data[ATTR_USERNAME]
         filepath = call.data[ATTR_FILEPATH]
         
         _LOGGER.info("Export followed artists called - username: %s, filepath: %s", username, filepath)
         
-        coordinator = get_coordinator_for_username(hass, username)
-        if not coordinator:
-            _LOGGER.error("No coordinator found for username: %s", username)
-            return
-        
         try:
             # Get all followed artists
-            followed_data = coordinator.data.get("followed_artists", {})
-            all_artists = followed_data.get("all_artists", [])
+            all_artists = (
+                await coordinator.top_stats_coordinator.async_get_all_followed_artists()
+            )
             
-            _LOGGER.debug("Found %s followed artists in coordinator data", len(all_artists))
+            _LOGGER.debug("Found %s followed artists", len(all_artists))
             
             if not all_artists:
                 _LOGGER.warning("No followed artists data available for %s", username)
@@ -150,9 +202,11 @@ async def async_setup_services(hass: HomeAssistant) -> None:
             
             _LOGGER.debug("Using absolute filepath: %s", filepath)
             
-            # Fetch complete metadata for all artists
-            artists_full = await hass.async_add_executor_job(
-                _fetch_all_artists_metadata, coordinator.sp, all_artists
+            # Fetch complete metadata for all artists, shared by all accounts
+            artists_full = await _fetch_all_artists_metadata(
+                coordinator.client,
+                all_artists,
+                hass.data[DOMAIN].setdefault("_artist_cache", {}),
             )
             
             export_data = {
@@ -162,15 +216,7 @@ async def async_setup_services(hass: HomeAssistant) -> None:
                 "artists": artists_full,
             }
             
-            # Ensure directory exists
-            directory = os.path.dirname(filepath)
-            if directory:
-                os.makedirs(directory, exist_ok=True)
-                _LOGGER.debug("Created directory: %s", directory)
-            
-            # Write JSON
-            with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(export_data, f, indent=2, ensure_ascii=False)
+            await hass.async_add_executor_job(_write_json_file, filepath, export_data)
             
             _LOGGER.info(
                 "Successfully exported %s followed artists for %s to %s",
@@ -181,19 +227,17 @@ async def async_setup_services(hass: HomeAssistant) -> None:
         except Exception as err:
             _LOGGER.error("Failed to export followed artists: %s", err, exc_info=True)
 
-    async def export_saved_library(call: ServiceCall) -> None:
+    @requires_coordinator
+    async def export_saved_library(
+        coordinator: SpotifyStatsCoordinator, call: ServiceCall
+    ) -> None:
         """Export saved albums and tracks to JSON."""
         username = call.data[ATTR_USERNAME]
         filepath = call.data[ATTR_FILEPATH]
         
-        coordinator = get_coordinator_for_username(hass, username)
-        if not coordinator:
-            return
-        
         try:
-            library_data = await hass.async_add_executor_job(
-                _fetch_saved_library, coordinator.sp
-            )
+            await coordinator.client.async_prepare()
+            library_data = await _fetch_saved_library(coordinator.client)
             
             export_data = {
                 "exported_at": dt_util.utcnow().isoformat(),
@@ -202,12 +246,7 @@ async def async_setup_services(hass: HomeAssistant) -> None:
                 "tracks": library_data["tracks"],
             }
             
-            # Ensure directory exists
-            os.makedirs(os.path.dirname(filepath), exist_ok=True)
-            
-            # Write JSON
-            with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(export_data, f, indent=2, ensure_ascii=False)
+            await hass.async_add_executor_job(_write_json_file, filepath, export_data)
             
             _LOGGER.info(
                 "Exported library for %s (%s albums, %s tracks) to %s",
@@ -219,27 +258,24 @@ async def async_setup_services(hass: HomeAssistant) -> None:
         except Exception as err:
             _LOGGER.error("Failed to export saved library: %s", err)
 
-    async def export_playlists(call: ServiceCall) -> None:
+    @requires_coordinator
+    async def export_playlists(
+        coordinator: SpotifyStatsCoordinator, call: ServiceCall
+    ) -> None:
         """Export playlists with track listings to JSON."""
         username = call.data[ATTR_USERNAME]
         filepath = call.data[ATTR_FILEPATH]
         
         _LOGGER.info("Export playlists called - username: %s, filepath: %s", username, filepath)
         
-        coordinator = get_coordinator_for_username(hass, username)
-        if not coordinator:
-            _LOGGER.error("No coordinator found for username: %s", username)
-            return
-        
         try:
             # Make filepath absolute if it's not
             if not os.path.isabs(filepath):
                 filepath = os.path.join(hass.config.config_dir, filepath)
             
             _LOGGER.debug("Fetching playlists via API")
-            playlists_data = await hass.async_add_executor_job(
-                _fetch_playlists, coordinator.sp
-            )
+            await coordinator.client.async_prepare()
+            playlists_data = await _fetch_playlists(coordinator.client)
             
             export_data = {
                 "exported_at": dt_util.utcnow().isoformat(),
@@ -248,14 +284,7 @@ async def async_setup_services(hass: HomeAssistant) -> None:
                 "playlists": playlists_data,
             }
             
-            # Ensure directory exists
-            directory = os.path.dirname(filepath)
-            if directory:
-                os.makedirs(directory, exist_ok=True)
-            
-            # Write JSON
-            with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(export_data, f, indent=2, ensure_ascii=False)
+            await hass.async_add_executor_job(_write_json_file, filepath, export_data)
             
             _LOGGER.info(
                 "Successfully exported %s playlists for %s to %s",
@@ -266,17 +295,16 @@ async def async_setup_services(hass: HomeAssistant) -> None:
         except Exception as err:
             _LOGGER.error("Failed to export playlists: %s", err, exc_info=True)
 
-    async def export_recently_played_csv(call: ServiceCall) -> None:
+    @requires_coordinator
+    async def export_recently_played_csv(
+        coordinator: SpotifyStatsCoordinator, call: ServiceCall
+    ) -> None:
         """Export recently played tracks to CSV."""
         username = call.data[ATTR_USERNAME]
         filepath = call.data[ATTR_FILEPATH]
         append = call.data[ATTR_APPEND]
         include_audio_features = call.data[ATTR_INCLUDE_AUDIO_FEATURES]
         
-        coordinator = get_coordinator_for_username(hass, username)
-        if not coordinator:
-            return
-        
         try:
             recently_played = coordinator.data.get("recently_played", {})
             tracks = recently_played.get("tracks", [])
@@ -285,17 +313,18 @@ async def async_setup_services(hass: HomeAssistant) -> None:
                 _LOGGER.warning("No recently played tracks to export for %s", username)
                 return
             
-            # Get existing timestamps to avoid duplicates
-            existing_timestamps = set()
-            if append and os.path.exists(filepath):
-                with open(filepath, "r", encoding="utf-8") as f:
-                    reader = csv.DictReader(f)
-                    existing_timestamps = {row["played_at"] for row in reader if "played_at" in row}
+            # Get existing timestamps to avoid duplicates, None if there's no file
+            existing_timestamps = None
+            if append:
+                existing_timestamps = await hass.async_add_executor_job(
+                    _read_played_at, filepath
+                )
+            append_to_file = existing_timestamps is not None
             
             # Filter new tracks
             new_tracks = [
                 track for track in tracks
-                if track["played_at"] not in existing_timestamps
+                if track["played_at"] not in (existing_timestamps or ())
             ]
             
             if not new_tracks:
@@ -304,75 +333,32 @@ async def async_setup_services(hass: HomeAssistant) -> None:
             
             # Fetch audio features if requested
             if include_audio_features:
-                track_ids = [t["track_id"] for t in new_tracks]
-                audio_features = await hass.async_add_executor_job(
-                    coordinator.sp.audio_features, track_ids
+                await coordinator.client.async_prepare()
+                audio_features = await _fetch_audio_features(
+                    coordinator.client, [t["track_id"] for t in new_tracks]
                 )
-                # Merge audio features into tracks
-                for track, features in zip(new_tracks, audio_features):
-                    if features:
-                        track.update({
-                            "danceability": features.get("danceability"),
-                            "energy": features.get("energy"),
-                            "key": features.get("key"),
-                            "loudness": features.get("loudness"),
-                            "mode": features.get("mode"),
-                            "speechiness": features.get("speechiness"),
-                            "acousticness": features.get("acousticness"),
-                            "instrumentalness": features.get("instrumentalness"),
-                            "liveness": features.get("liveness"),
-                            "valence": features.get("valence"),
-                            "tempo": features.get("tempo"),
-                        })
-            
-            # Ensure directory exists
-            os.makedirs(os.path.dirname(filepath), exist_ok=True)
-            
-            # Define CSV columns
-            columns = [
-                "username",
-                "played_at",
-                "track_id",
-                "track_name",
-                "artist_id",
-                "artist_name",
-                "album_name",
-                "album_id",
-                "duration_ms",
-                "popularity",
-                "explicit",
-                "track_url",
-            ]
-            
-            if include_audio_features:
-                columns.extend([
-                    "danceability",
-                    "energy",
-                    "key",
-                    "loudness",
-                    "mode",
-                    "speechiness",
-                    "acousticness",
-                    "instrumentalness",
-                    "liveness",
-                    "valence",
-                    "tempo",
-                ])
+                # Merge audio features into copies, the tracks belong to the coordinator.
+                # Spotify answers every id in order, None when it has no features.
+                new_tracks = [
+                    track | {key: features[key] for key in _AUDIO_KEYS & features.keys()}
+                    if features
+                    else track
+                    for track, features in zip(new_tracks, audio_features, strict=True)
+                ]
+            
+            columns = (
+                _RECENT_AUDIO_COLUMNS if include_audio_features else _RECENT_COLUMNS
+            )
             
             # Write CSV
-            mode = "a" if append and os.path.exists(filepath) else "w"
-            write_header = not (append and os.path.exists(filepath))
-            
-            with open(filepath, mode, encoding="utf-8", newline="") as f:
-                writer = csv.DictWriter(f, fieldnames=columns)
-                
-                if write_header:
-                    writer.writeheader()
-                
-                for track in new_tracks:
-                    row = {"username": username}
-                    row.update({col: track.get(col, "") for col in columns if col != "username"})
-                    writer.writerow(row)
+            track_columns = columns[1:]  # Everything after username
+            rows = [
+                [username, *(track.get(col, "") for col in track_columns)]
+                for track in new_tracks
+            ]
+            await hass.async_add_executor_job(
+                _write_csv_file, filepath, columns, rows, append_to_file
+            )
             
             _LOGGER.info(
                 "Exported %s tracks for %s to %s",
@@ -383,17 +369,16 @@ async def async_setup_services(hass: HomeAssistant) -> None:
         except Exception as err:
             _LOGGER.error("Failed to export recently played CSV: %s", err)
 
-    async def export_top_stats_csv(call: ServiceCall) -> None:
+    @requires_coordinator
+    async def export_top_stats_csv(
+        coordinator: SpotifyStatsCoordinator, call: ServiceCall
+    ) -> None:
         """Export top stats snapshot to CSV."""
         username = call.data[ATTR_USERNAME]
         filepath = call.data[ATTR_FILEPATH]
         entity_type = call.data[ATTR_ENTITY_TYPE]
         time_range = call.data[ATTR_TIME_RANGE]
         
-        coordinator = get_coordinator_for_username(hass, username)
-        if not coordinator:
-            return
-        
         try:
             # Map time_range to period key
             period_map = {
@@ -405,49 +390,54 @@ async def async_setup_services(hass: HomeAssistant) -> None:
             
             # Get data
             data_key = f"top_{entity_type}_{period}"
-            data = coordinator.data.get(data_key, {})
+            data = coordinator.top_stats_coordinator.data.get(data_key, {})
             items = data.get(entity_type, [])
             
             if not items:
                 _LOGGER.warning("No %s data to export for %s", entity_type, username)
                 return
             
-            # Ensure directory exists
-            os.makedirs(os.path.dirname(filepath), exist_ok=True)
+            columns = (
+                _TOP_ARTIST_COLUMNS if entity_type == "artists" else _TOP_TRACK_COLUMNS
+            )
+            export_date = dt_util.utcnow().date().isoformat()
             
-            # Define CSV columns
+            # Rows follow the column order of the header
             if entity_type == "artists":
-                columns = ["username", "export_date", "rank", "id", "name", "url", "genres", "popularity"]
+                rows = [
+                    [
+                        username,
+                        export_date,
+                        item.get("rank"),
+                        item.get("id"),
+                        item.get("name"),
+                        item.get("url"),
+                        ";".join(item.get("genres", [])),
+                        item.get("popularity", ""),
+                    ]
+                    for item in items
+                ]
             else:  # tracks
-                columns = ["username", "export_date", "rank", "id", "name", "artist_name", "artist_id", "album_name", "url", "popularity"]
+                rows = [
+                    [
+                        username,
+                        export_date,
+                        item.get("rank"),
+                        item.get("id"),
+                        item.get("name"),
+                        item.get("artist_name"),
+                        item.get("artist_id"),
+                        item.get("album_name"),
+                        item.get("url"),
+                        item.get("popularity", ""),
+                    ]
+                    for item in items
+                ]
             
             # Write CSV
-            with open(filepath, "w", encoding="utf-8", newline="") as f:
-                writer = csv.DictWriter(f, fieldnames=columns)
-                writer.writeheader()
-                
-                export_date = dt_util.utcnow().date().isoformat()
-                
-                for item in items:
-                    row = {
-                        "username": username,
-                        "export_date": export_date,
-                        "rank": item.get("rank"),
-                        "id": item.get("id"),
-                        "name": item.get("name"),
-                        "url": item.get("url"),
-                    }
-                    
-                    if entity_type == "artists":
-                        row["genres"] = ";".join(item.get("genres", []))
-                        row["popularity"] = item.get("popularity", "")
-                    else:  # tracks
-                        row["artist_name"] = item.get("artist_name")
-                        row["artist_id"] = item.get("artist_id")
-                        row["album_name"] = item.get("album_name")
-                        row["popularity"] = item.get("popularity", "")
-                    
-                    writer.writerow(row)
+            await hass.async_add_executor_job(
+                _write_csv_file, filepath, columns, rows, False
+            )
             
             _LOGGER.info(
                 "Exported %s top %s for %s to %s",
@@ -459,30 +449,28 @@ async def async_setup_services(hass: HomeAssistant) -> None:
         except Exception as err:
             _LOGGER.error("Failed to export top stats CSV: %s", err)
 
-    async def set_update_interval(call: ServiceCall) -> None:
+    @requires_coordinator
+    async def set_update_interval(
+        coordinator: SpotifyStatsCoordinator, call: ServiceCall
+    ) -> None:
         """Set update intervals for a user."""
         username = call.data[ATTR_USERNAME]
         now_playing = call.data.get(CONF_NOW_PLAYING_INTERVAL)
         recently_played = call.data.get(CONF_RECENTLY_PLAYED_INTERVAL)
         
-        coordinator = get_coordinator_for_username(hass, username)
-        if not coordinator:
-            return
-        
         try:
             await coordinator.async_set_update_interval(now_playing, recently_played)
             _LOGGER.info("Updated intervals for %s", username)
         except Exception as err:
             _LOGGER.error("Failed to set update interval: %s", err)
 
-    async def refresh_now_playing(call: ServiceCall) -> None:
+    @requires_coordinator
+    async def refresh_now_playing(
+        coordinator: SpotifyStatsCoordinator, call: ServiceCall
+    ) -> None:
         """Immediately refresh now playing sensor."""
         username = call.data[ATTR_USERNAME]
         
-        coordinator = get_coordinator_for_username(hass, username)
-        if not coordinator:
-            return
-        
         try:
             await coordinator.async_request_refresh()
             _LOGGER.info("Refreshed now playing for %s", username)
@@ -542,55 +530,193 @@ async def async_setup_services(hass: HomeAssistant) -> None:
     _LOGGER.info("Registered Spotify Statistics services")
 
 
-def _fetch_all_artists_metadata(sp, artists: list[dict]) -> list[dict]:
-    """Fetch complete metadata for all artists."""
-    result = []
+@callback
+def async_unload_services(hass: HomeAssistant) -> None:
+    """Remove services for Spotify Statistics."""
+    for service in (
+        SERVICE_EXPORT_FOLLOWED_ARTISTS,
+        SERVICE_EXPORT_SAVED_LIBRARY,
+        SERVICE_EXPORT_PLAYLISTS,
+        SERVICE_EXPORT_RECENTLY_PLAYED_CSV,
+        SERVICE_EXPORT_TOP_STATS_CSV,
+        SERVICE_SET_UPDATE_INTERVAL,
+        SERVICE_REFRESH_NOW_PLAYING,
+    ):
+        hass.services.async_remove(DOMAIN, service)
+    
+    _LOGGER.info("Removed Spotify Statistics services")
+
+
+async def _async_get_with_retry(
+    client: SpotifyStatsClient, path: str, **params: Any
+) -> dict[str, Any] | None:
+    """Issue an export request, retrying when rate limited or on server errors.
+
+    A 429 waits for Spotify's Retry-After, 5xx errors back off exponentially.
+    Re-requesting one page is far cheaper than re-running the whole export.
+    """
+    for attempt in range(_RETRY_ATTEMPTS - 1):
+        try:
+            return await client.async_export_get(path, **params)
+        except spotipy.exceptions.SpotifyException as err:
+            delay = _RETRY_BASE_DELAY * 2**attempt
+            if err.http_status == 429:
+                delay = float(err.headers.get("Retry-After", delay))
+            elif not 500 <= err.http_status < 600:
+                raise
+            if delay > _RETRY_MAX_DELAY:
+                raise
+            _LOGGER.debug(
+                "Spotify returned %s for %s, retrying in %s seconds",
+                err.http_status,
+                path,
+                delay,
+            )
+            await asyncio.sleep(delay)
     
-    for artist in artists:
+    # Out of retries, let the last failure propagate
+    return await client.async_export_get(path, **params)
+
+
+async def _fetch_all_artists_metadata(
+    client: SpotifyStatsClient,
+    artists: list[dict],
+    cache: dict[str, tuple[float, dict]],
+) -> list[dict]:
+    """Fetch complete metadata for all artists.
+
+    Artists fetched within the last day are taken from the cache, keyed by
+    artist id with the monotonic time they were fetched.
+    """
+    now = time.monotonic()
+    for artist_id in [
+        artist_id
+        for artist_id, (fetched_at, _) in cache.items()
+        if now - fetched_at >= _ARTIST_CACHE_TTL
+    ]:
+        del cache[artist_id]
+    
+    missing = [artist for artist in artists if artist["id"] not in cache]
+    
+    # Spotify returns up to 50 artists per request
+    for start in range(0, len(missing), _ARTISTS_BATCH_SIZE):
+        chunk = missing[start:start + _ARTISTS_BATCH_SIZE]
         try:
-            full_artist = sp.artist(artist["id"])
-            result.append({
-                "id": full_artist["id"],
-                "name": full_artist["name"],
-                "url": full_artist["external_urls"]["spotify"],
-                "uri": full_artist["uri"],
-                "followers": full_artist["followers"]["total"],
-                "genres": full_artist.get("genres", []),
-                "images": full_artist.get("images", []),
-                "popularity": full_artist.get("popularity", 0),
-                "type": full_artist["type"],
-            })
+            full_artists = (
+                await _async_get_with_retry(
+                    client, "artists", ids=",".join(artist["id"] for artist in chunk)
+                )
+            )["artists"]
         except Exception as err:
-            _LOGGER.warning("Failed to fetch artist %s: %s", artist["id"], err)
-            result.append(artist)  # Use basic data if fetch fails
+            _LOGGER.warning("Failed to fetch %s artists: %s", len(chunk), err)
+            continue
+        
+        # Results come back in request order, None for unknown ids
+        for artist, full_artist in zip(chunk, full_artists):
+            if full_artist is None:
+                _LOGGER.warning("Artist %s not found", artist["id"])
+                continue
+            try:
+                cache[artist["id"]] = (now, {
+                    "id": full_artist["id"],
+                    "name": full_artist["name"],
+                    "url": full_artist["external_urls"]["spotify"],
+                    "uri": full_artist["uri"],
+                    "followers": full_artist["followers"]["total"],
+                    "genres": full_artist.get("genres", []),
+                    "images": full_artist.get("images", []),
+                    "popularity": full_artist.get("popularity", 0),
+                    "type": full_artist["type"],
+                })
+            except Exception as err:
+                _LOGGER.warning("Failed to parse artist %s: %s", artist["id"], err)
     
-    return result
+    # Use basic data for artists that couldn't be fetched
+    return [
+        cache[artist["id"]][1] if artist["id"] in cache else artist
+        for artist in artists
+    ]
+
+
+async def _iter_pages(
+    client: SpotifyStatsClient, path: str
+) -> AsyncIterator[list[dict]]:
+    """Yield the items of an offset paged endpoint, one page at a time."""
+    first = await _async_get_with_retry(client, path, limit=_PAGE_SIZE)
+    yield first["items"]
+    
+    # The first page reports the total, so the rest can be requested together.
+    # The rate limiter's export slots bound how many are in flight.
+    pending = [
+        asyncio.create_task(
+            _async_get_with_retry(client, path, limit=_PAGE_SIZE, offset=offset)
+        )
+        for offset in range(_PAGE_SIZE, first["total"], _PAGE_SIZE)
+    ]
+    try:
+        for page in pending:
+            yield (await page)["items"]
+    finally:
+        # Don't leave requests running if the caller stopped early
+        for page in pending:
+            page.cancel()
+
+
+async def _fetch_all_pages(client: SpotifyStatsClient, path: str) -> list[dict]:
+    """Fetch every item of an offset paged endpoint."""
+    return [item async for page in _iter_pages(client, path) for item in page]
+
+
+def _json_fragment(item: dict[str, Any], depth: int) -> orjson.Fragment:
+    """Encode an export item as it arrives, so the export holds bytes, not objects.
+
+    The item ends up nested depth levels deep in the indented document, its
+    lines are indented to match. orjson escapes newlines inside strings, so
+    every newline in the output is a line break.
+    """
+    return orjson.Fragment(
+        orjson.dumps(item, option=orjson.OPT_INDENT_2).replace(
+            b"\n", b"\n" + b"  " * depth
+        )
+    )
+
+
+async def _fetch_encoded_pages(
+    client: SpotifyStatsClient, path: str, depth: int
+) -> list[orjson.Fragment]:
+    """Fetch every item of an offset paged endpoint, encoded page by page."""
+    return [
+        _json_fragment(item, depth)
+        async for page in _iter_pages(client, path)
+        for item in page
+    ]
+
+
+async def _fetch_audio_features(
+    client: SpotifyStatsClient, track_ids: list[str]
+) -> list[dict | None]:
+    """Fetch audio features for tracks, in request order."""
+    # Spotify accepts up to 100 ids per request
+    results = await asyncio.gather(
+        *(
+            _async_get_with_retry(
+                client,
+                "audio-features",
+                ids=",".join(track_ids[start:start + _AUDIO_FEATURES_BATCH_SIZE]),
+            )
+            for start in range(0, len(track_ids), _AUDIO_FEATURES_BATCH_SIZE)
+        )
+    )
+    return [features for result in results for features in result["audio_features"]]
 
 
-def _fetch_saved_library(sp) -> dict[str, Any]:
+async def _fetch_saved_library(client: SpotifyStatsClient) -> dict[str, Any]:
     """Fetch all saved albums and tracks."""
-    albums = []
-    tracks = []
-    
-    # Fetch albums
-    offset = 0
-    while True:
-        results = sp.current_user_saved_albums(limit=50, offset=offset)
-        albums.extend(results["items"])
-        
-        if not results["next"]:
-            break
-        offset += 50
-    
-    # Fetch tracks
-    offset = 0
-    while True:
-        results = sp.current_user_saved_tracks(limit=50, offset=offset)
-        tracks.extend(results["items"])
-        
-        if not results["next"]:
-            break
-        offset += 50
+    # Items sit under "albums"/"tracks" -> "items" in the export
+    albums, tracks = await asyncio.gather(
+        _fetch_encoded_pages(client, "me/albums", 3),
+        _fetch_encoded_pages(client, "me/tracks", 3),
+    )
     
     return {
         "albums": {
@@ -604,45 +730,105 @@ def _fetch_saved_library(sp) -> dict[str, Any]:
     }
 
 
-def _fetch_playlists(sp) -> list[dict]:
-    """Fetch all playlists with full track listings."""
-    playlists = []
+async def _fetch_playlists(client: SpotifyStatsClient) -> list[orjson.Fragment]:
+    """Fetch all playlists with full track listings, encoded for the export."""
+    # Get user's playlists, then their full listings concurrently. The
+    # rate limiter's export slots bound how many are in flight.
+    results = await asyncio.gather(
+        *(
+            _fetch_full_playlist(client, playlist)
+            for playlist in await _fetch_all_pages(client, "me/playlists")
+        )
+    )
+    return [playlist for playlist in results if playlist is not None]
+
+
+async def _fetch_full_playlist(
+    client: SpotifyStatsClient, playlist: dict[str, Any]
+) -> orjson.Fragment | None:
+    """Fetch a playlist with its tracks, None if it can't be exported."""
+    try:
+        # Fetch full playlist with tracks
+        full_playlist = await _async_get_with_retry(
+            client, f"playlists/{playlist['id']}"
+        )
+        return _json_fragment(full_playlist, 2)
+    except spotipy.exceptions.SpotifyException as err:
+        if err.http_status == 404:
+            _LOGGER.warning(
+                "Playlist %s (%s) not found (deleted or private), skipping",
+                playlist["name"],
+                playlist["id"],
+            )
+            # Add basic info without tracks
+            return _json_fragment({
+                "id": playlist["id"],
+                "name": playlist["name"],
+                "owner": playlist["owner"],
+                "tracks": {"total": playlist["tracks"]["total"]},
+                "public": playlist.get("public"),
+                "collaborative": playlist.get("collaborative"),
+                "external_urls": playlist.get("external_urls", {}),
+                "note": "Unable to fetch full details (404 error)",
+            }, 2)
+        _LOGGER.error("Error fetching playlist %s: %s", playlist["id"], err)
+    except Exception as err:
+        _LOGGER.error("Unexpected error fetching playlist %s: %s", playlist["id"], err)
+    return None
+
+
+def _write_file_atomic(filepath: str, data: bytes) -> None:
+    """Replace a file in one step, creating its directory.
+
+    The data goes to a temporary file that is renamed over the export, so an
+    interrupted write never leaves a truncated file behind.
+    """
+    directory = os.path.dirname(filepath)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
     
-    # Get user's playlists
-    offset = 0
-    while True:
-        results = sp.current_user_playlists(limit=50, offset=offset)
-        
-        for playlist in results["items"]:
-            try:
-                # Fetch full playlist with tracks
-                full_playlist = sp.playlist(playlist["id"])
-                playlists.append(full_playlist)
-            except spotipy.exceptions.SpotifyException as err:
-                if err.http_status == 404:
-                    _LOGGER.warning(
-                        "Playlist %s (%s) not found (deleted or private), skipping",
-                        playlist["name"],
-                        playlist["id"],
-                    )
-                    # Add basic info without tracks
-                    playlists.append({
-                        "id": playlist["id"],
-                        "name": playlist["name"],
-                        "owner": playlist["owner"],
-                        "tracks": {"total": playlist["tracks"]["total"]},
-                        "public": playlist.get("public"),
-                        "collaborative": playlist.get("collaborative"),
-                        "external_urls": playlist.get("external_urls", {}),
-                        "note": "Unable to fetch full details (404 error)",
-                    })
-                else:
-                    _LOGGER.error("Error fetching playlist %s: %s", playlist["id"], err)
-            except Exception as err:
-                _LOGGER.error("Unexpected error fetching playlist %s: %s", playlist["id"], err)
-        
-        if not results["next"]:
-            break
-        offset += 50
+    write_utf8_file_atomic(filepath, data, mode="wb")
+
+
+def _write_json_file(filepath: str, data: dict[str, Any]) -> None:
+    """Write an export as indented JSON."""
+    _write_file_atomic(filepath, orjson.dumps(data, option=orjson.OPT_INDENT_2))
+
+
+def _write_csv_file(
+    filepath: str, columns: tuple[str, ...], rows: list[list[Any]], append: bool
+) -> None:
+    """Write CSV rows, appending to the existing file without a new header."""
+    buffer = io.StringIO(newline="")
+    writer = csv.writer(buffer)
+    if not append:
+        writer.writerow(columns)
+    writer.writerows(rows)
+    
+    if not append:
+        _write_file_atomic(filepath, buffer.getvalue().encode("utf-8"))
+        return
+    
+    # Appending keeps the history already in the file, write just the new rows
+    with open(filepath, "a", encoding="utf-8", newline="") as f:
+        f.write(buffer.getvalue())
+
+
+def _read_played_at(filepath: str) -> set[str] | None:
+    """Return the played_at timestamps already in a recently played CSV.
+
+    Returns None when there is no file yet to append to.
+    """
+    try:
+        f = open(filepath, "r", encoding="utf-8", newline="")
+    except FileNotFoundError:
+        return None
     
-    return playlists
+    with f:
+        # Only one column is needed, don't build a dict for every row
+        reader = csv.reader(f)
+        header = next(reader, [])
+        if "played_at" not in header:
+            return set()
+        index = header.index("played_at")
+        return {row[index] for row in reader if len(row) > index}